@@ -3,6 +3,8 @@
 Test vLLM connection and agent functionality.
 """
 
+import asyncio
+import functools
 import sys
 from pathlib import Path
 
@@ -13,12 +15,12 @@ if src_path.exists():
 
 try:
     from gpt_oss_agent.config import get_settings
-    from gpt_oss_agent.clients import setup_vllm_client
+    from gpt_oss_agent.clients import AsyncVLLMClient
     from gpt_oss_agent.tools import check_all_tools_status
     from gpt_oss_agent.core import create_agent
     from gpt_oss_agent.utils import setup_logging
     
-    def main():
+    async def main():
         print("🧪 Testing GPT-OSS Agent Connection")
         print("=" * 40)
         
@@ -26,11 +28,21 @@ try:
         settings = get_settings()
         setup_logging(settings)
         
+        # Tests 1 and 2 are independent probes, so run them concurrently
+        # run_in_executor rather than asyncio.to_thread, which needs Python 3.9
+        loop = asyncio.get_running_loop()
+        async with AsyncVLLMClient(settings) as client:
+            test_result, tools_status = await asyncio.gather(
+                client.test_connection(),
+                loop.run_in_executor(None, functools.partial(check_all_tools_status, settings)),
+                return_exceptions=True,
+            )
+        
         # Test 1: vLLM Connection
         print("\n1️⃣ Testing vLLM connection...")
         try:
-            client = setup_vllm_client(wait_for_server=False)
-            test_result = client.test_connection()
+            if isinstance(test_result, BaseException):
+                raise test_result
             
             if test_result["health_check_passed"]:
                 print("   ✅ vLLM server is accessible")
@@ -56,7 +68,8 @@ try:
         # Test 2: Tools Status
         print("\n2️⃣ Testing tools...")
         try:
-            tools_status = check_all_tools_status(settings)
+            if isinstance(tools_status, BaseException):
+                raise tools_status
             print(f"   📊 Available tools: {tools_status['available_tools']}/{tools_status['total_tools']}")
             
             if tools_status["available_tool_names"]:
@@ -84,7 +97,7 @@ try:
         # Test 4: Simple Chat
         print("\n4️⃣ Testing simple chat...")
         try:
-            response = agent.chat("Hello! Please respond with just 'Test successful' and nothing else.")
+            response = await agent.achat("Hello! Please respond with just 'Test successful' and nothing else.")
             
             if response and len(response.strip()) > 0:
                 print("   ✅ Chat test successful")
@@ -111,7 +124,7 @@ try:
         return True
     
     if __name__ == "__main__":
-        success = main()
+        success = asyncio.run(main())
         sys.exit(0 if success else 1)
         
 except ImportError as e:
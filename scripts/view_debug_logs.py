@@ -4,39 +4,105 @@ Utility script to view and analyze debug logs.
 Updated version that works with the restructured codebase.
 """
 
+import mmap
+import os
+import re
 import sys
 import argparse
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+# Add src directory to path for development
+src_path = Path(__file__).parent.parent / "src"
+if src_path.exists():
+    sys.path.insert(0, str(src_path))
+
+from gpt_oss_agent.utils.serialization import dumps_bytes, loads
+
+# Upper bound on threads used to load a session's log files
+MAX_LOAD_WORKERS = 8
+
+# Files at least this large are memory-mapped instead of read into a buffer
+MMAP_THRESHOLD = 1024 * 1024
+
+# Log files are named <session_id>_msg<NNN>_<kind>.json
+SESSION_FILE_PATTERN = re.compile(r"^(.+?)_msg\d+_.*\.json$")
 
 def list_sessions(log_dir: str = "logs/debug") -> List[str]:
     """List all debug sessions."""
-    log_path = Path(log_dir)
-    if not log_path.exists():
+    sessions = set()
+    try:
+        with os.scandir(log_dir) as entries:
+            for entry in entries:
+                match = SESSION_FILE_PATTERN.match(entry.name)
+                if match:
+                    sessions.add(match.group(1))
+    except FileNotFoundError:
         return []
     
-    sessions = set()
-    for file in log_path.glob("*.json"):
-        session_id = file.name.split("_msg")[0]
-        sessions.add(session_id)
+    return sorted(sessions)
+
+def latest_session(log_dir: str = "logs/debug") -> Optional[str]:
+    """Return the most recent session ID in one directory pass, without sorting."""
+    latest = None
+    try:
+        with os.scandir(log_dir) as entries:
+            for entry in entries:
+                match = SESSION_FILE_PATTERN.match(entry.name)
+                if match and (latest is None or match.group(1) > latest):
+                    latest = match.group(1)
+    except FileNotFoundError:
+        return None
     
-    return sorted(list(sessions))
+    return latest
 
 def get_session_files(session_id: str, log_dir: str = "logs/debug") -> List[Path]:
     """Get all files for a session."""
+    prefix = f"{session_id}_"
+    try:
+        with os.scandir(log_dir) as entries:
+            names = [
+                entry.name for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith(".json")
+            ]
+    except FileNotFoundError:
+        return []
+    
     log_path = Path(log_dir)
-    return sorted(log_path.glob(f"{session_id}_*.json"))
+    return [log_path / name for name in sorted(names)]
 
 def load_log_file(filepath: Path) -> Dict[str, Any]:
     """Load a log file."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        # loads parses straight from bytes (with orjson when installed);
+        # large transcripts are parsed from a memory map to skip the copy
+        with open(filepath, "rb") as f:
+            if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+                return loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return loads(view)
     except Exception as e:
         return {"error": str(e), "filepath": str(filepath)}
 
+def load_log_files(files: List[Path]) -> List[Dict[str, Any]]:
+    """Load several log files concurrently, preserving order.
+    
+    File reads release the GIL, so a small thread pool overlaps the I/O of
+    sessions with many files. JSON parsing still holds the GIL and runs one
+    file at a time.
+    """
+    if len(files) <= 1:
+        return [load_log_file(file) for file in files]
+    
+    with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(files))) as executor:
+        return list(executor.map(load_log_file, files))
+
+def write_output(lines: List[str]) -> None:
+    """Write buffered output lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 def print_session_summary(session_id: str, log_dir: str = "logs/debug"):
     """Print summary of a debug session."""
     files = get_session_files(session_id, log_dir)
@@ -44,15 +110,13 @@ def print_session_summary(session_id: str, log_dir: str = "logs/debug"):
         print(f"No files found for session: {session_id}")
         return
     
-    print(f"\n🔍 Debug Session: {session_id}")
-    print("=" * 60)
+    out = [f"\n🔍 Debug Session: {session_id}", "=" * 60]
     
     messages = {}
     
-    for file in files:
-        data = load_log_file(file)
+    for file, data in zip(files, load_log_files(files)):
         if "error" in data and "filepath" in data:
-            print(f"❌ Error loading: {file.name}")
+            out.append(f"❌ Error loading: {file.name}")
             continue
         
         msg_count = data.get("message_count", 0)
@@ -64,43 +128,45 @@ def print_session_summary(session_id: str, log_dir: str = "logs/debug"):
     
     for msg_count in sorted(messages.keys()):
         msg_data = messages[msg_count]
-        print(f"\n📨 Message {msg_count}:")
+        out.append(f"\n📨 Message {msg_count}:")
         
         # User input
         if "user_input" in msg_data:
             input_data = msg_data["user_input"]
-            print(f"   👤 Input: {input_data['message'][:100]}...")
-            print(f"       Length: {input_data['message_length']} chars")
+            out.append(f"   👤 Input: {input_data['message'][:100]}...")
+            out.append(f"       Length: {len(input_data.get('message', ''))} chars")
         
         # Tool executions
         for log_type, data in msg_data.items():
             if log_type.startswith("tool_"):
                 tool_name = data.get("tool_name", log_type.replace("tool_", ""))
                 success = "✅" if data.get("success", False) else "❌"
-                result_len = data.get("result_length", 0)
-                print(f"   🔧 Tool: {tool_name} {success} ({result_len} chars)")
+                result_len = len(data.get("result") or "")
+                out.append(f"   🔧 Tool: {tool_name} {success} ({result_len} chars)")
         
         # Agent response
         if "agent_response" in msg_data:
             response_data = msg_data["agent_response"]
             is_empty = response_data.get("is_empty", True)
-            response_len = response_data.get("response_length", 0)
+            response_len = len(response_data.get("response") or "")
             status = "❌ Empty" if is_empty else "✅ Success"
-            print(f"   🤖 Response: {status} ({response_len} chars)")
+            out.append(f"   🤖 Response: {status} ({response_len} chars)")
             
             if not is_empty:
                 response_preview = response_data.get("response", "")[:100]
-                print(f"       Preview: {response_preview}...")
+                out.append(f"       Preview: {response_preview}...")
         
         # Runner result details
         if "runner_result" in msg_data:
             result_data = msg_data["runner_result"]
             had_output = result_data.get("has_final_output", False)
-            output_len = result_data.get("final_output_length", 0)
+            output_len = len(str(result_data.get("final_output") or ""))
             new_items = result_data.get("new_items_info", [])
             
-            print(f"   🏃 Runner: {'✅' if had_output else '❌'} final_output ({output_len} chars)")
-            print(f"       Items: {len(new_items)} ({', '.join([item.get('type', 'unknown') for item in new_items[:3]])})") 
+            out.append(f"   🏃 Runner: {'✅' if had_output else '❌'} final_output ({output_len} chars)")
+            out.append(f"       Items: {len(new_items)} ({', '.join([item.get('type', 'unknown') for item in new_items[:3]])})") 
+    
+    write_output(out)
 
 def print_detailed_log(session_id: str, message_num: int, log_dir: str = "logs/debug"):
     """Print detailed log for a specific message."""
@@ -112,14 +178,15 @@ def print_detailed_log(session_id: str, message_num: int, log_dir: str = "logs/d
         print(f"No logs found for session {session_id}, message {message_num}")
         return
     
-    print(f"\n📋 Detailed Log - Session: {session_id}, Message: {message_num}")
-    print("=" * 80)
+    out = [f"\n📋 Detailed Log - Session: {session_id}, Message: {message_num}", "=" * 80]
     
-    for file in sorted(target_files):
-        data = load_log_file(file)
-        print(f"\n📄 {file.name}")
-        print("-" * 40)
-        print(json.dumps(data, indent=2, ensure_ascii=False))
+    target_files.sort()
+    for file, data in zip(target_files, load_log_files(target_files)):
+        out.append(f"\n📄 {file.name}")
+        out.append("-" * 40)
+        out.append(dumps_bytes(data).decode())
+    
+    write_output(out)
 
 def main():
     parser = argparse.ArgumentParser(description="View GPT-OSS Agent debug logs")
@@ -147,9 +214,8 @@ def main():
     
     else:
         # Show latest session by default
-        sessions = list_sessions(args.log_dir)
-        if sessions:
-            latest = sessions[-1]
+        latest = latest_session(args.log_dir)
+        if latest:
             print(f"Showing latest session: {latest}")
             print_session_summary(latest, args.log_dir)
         else:
@@ -1,11 +1,27 @@
 """GPT-OSS Agent - A Python-based AI agent for local GPT-OSS models."""
 
+import importlib
+import logging
+from typing import Any, List
+
 from .__version__ import __version__
-from .config import get_settings, Settings
-from .core import GPTOSSAgent, create_agent
-from .cli import main, quick_chat
-from .tools import get_available_tools
-from .exceptions import GPTOSSAgentError
+
+# Library logging stays silent unless the application configures handlers
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+# Public names and the submodules providing them. They are imported on first
+# access (PEP 562) so that importing the package, or the CLI entry point,
+# does not load the agents SDK and every subpackage up front.
+_LAZY_EXPORTS = {
+    "get_settings": ".config",
+    "Settings": ".config",
+    "GPTOSSAgent": ".core",
+    "create_agent": ".core",
+    "main": ".cli",
+    "quick_chat": ".cli",
+    "get_available_tools": ".tools",
+    "GPTOSSAgentError": ".exceptions",
+}
 
 __all__ = [
     "__version__",
@@ -17,4 +33,18 @@ __all__ = [
     "quick_chat",
     "get_available_tools",
     "GPTOSSAgentError",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
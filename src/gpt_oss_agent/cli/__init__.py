@@ -1,11 +1,25 @@
 """CLI interface."""
 
+from typing import Any, List
+
 from .app import main, quick_chat, test_agent
-from .commands import interactive_chat
 
 __all__ = [
     "main",
     "quick_chat",
     "test_agent", 
     "interactive_chat",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    # The interactive module pulls in Markdown/prompt rendering that the
+    # one-shot modes (--chat, --info, --test) never use, so load it on demand
+    if name == "interactive_chat":
+        from .commands import interactive_chat
+        return interactive_chat
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
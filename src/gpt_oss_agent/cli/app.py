@@ -1,26 +1,44 @@
 """Main CLI application for GPT-OSS Agent."""
 
 import argparse
+import asyncio
+import functools
 import logging
 import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional, Tuple
 
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-from ..config import get_settings, setup_openai_env
-from ..clients import setup_vllm_client, get_model_info
-from ..core import create_agent
-from ..tools import get_available_tools, check_all_tools_status
+from ..config import Settings, get_settings, setup_openai_env
 from ..utils import setup_logging, get_debug_logger
 from ..exceptions import GPTOSSAgentError
 
+# The agent stack (agents SDK, openai, httpx) is imported inside the commands
+# that need it, so `--help` and argument errors return without loading it
+if TYPE_CHECKING:
+    from ..core import GPTOSSAgent
+
 
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Guards the cached default agents, which each run chats on one private
+# event loop and so cannot serve two threads at once
+_default_agent_lock = threading.Lock()
+
+
+def _install_uvloop() -> None:
+    """Use uvloop for new asyncio event loops when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop policy")
+
 
 def setup_application() -> None:
     """Set up the application with logging and configuration."""
@@ -29,14 +47,53 @@ def setup_application() -> None:
     # Set up logging
     setup_logging(settings)
     
+    # Agents create their event loops through the policy, so this must
+    # happen before any agent is used
+    _install_uvloop()
+    
     # Set up OpenAI environment for vLLM compatibility
     setup_openai_env(settings)
     
     logger.info("GPT-OSS Agent application initialized")
 
 
+@functools.lru_cache(maxsize=4)
+def _get_default_agent(model: Optional[str], enable_tools: bool) -> "GPTOSSAgent":
+    """Get a process-wide agent for one-off chats.
+    
+    Agents are cached per ``(model, enable_tools)`` so repeated calls skip
+    tool discovery, instruction building and client setup. Call
+    ``_get_default_agent.cache_clear()`` to force a rebuild. Callers must
+    hold ``_default_agent_lock`` while building or using the agent.
+    
+    Args:
+        model: Model to use (uses configured model if None)
+        enable_tools: Whether to load available tools
+        
+    Returns:
+        Cached GPTOSSAgent instance
+    """
+    from ..core import create_agent
+    from ..tools import get_available_tools
+    
+    settings = get_settings()
+    
+    # Override model on a copy so the global settings stay untouched
+    if model:
+        settings = settings.model_copy(deep=True)
+        settings.vllm.model = model
+    
+    # Get available tools
+    tools = get_available_tools(settings) if enable_tools else []
+    
+    return create_agent(settings=settings, tools=tools)
+
+
 def quick_chat(message: str, model: Optional[str] = None) -> str:
-    """Quick one-off chat without creating persistent agent.
+    """Quick one-off chat using a cached default agent.
+    
+    Safe to call from several threads; calls share the cached agent and
+    are run one at a time.
     
     Args:
         message: Message to send to agent
@@ -47,19 +104,11 @@ def quick_chat(message: str, model: Optional[str] = None) -> str:
     """
     try:
         settings = get_settings()
-        
-        # Override model if specified
-        if model:
-            settings.vllm.model = model
-        
-        # Get available tools
-        tools = get_available_tools(settings)
-        
-        # Create agent
-        agent = create_agent(settings=settings, tools=tools)
-        
-        # Send message
-        response = agent.chat(message)
+        with _default_agent_lock:
+            agent = _get_default_agent(model, settings.agent.enable_tools)
+            
+            # Send message
+            response = agent.chat(message)
         return response
         
     except Exception as e:
@@ -73,12 +122,16 @@ def test_agent() -> bool:
     Returns:
         True if test passed, False otherwise
     """
+    from ..clients import setup_vllm_client
+    from ..core import create_agent
+    from ..tools import get_available_tools
+    
     try:
         console.print("🧪 Testing agent functionality...", style="yellow")
         
         # Test vLLM connection
-        client = setup_vllm_client()
-        test_result = client.test_connection()
+        with setup_vllm_client() as client:
+            test_result = client.test_connection()
         
         if not test_result["health_check_passed"]:
             console.print("❌ vLLM server connection failed", style="red")
@@ -105,10 +158,42 @@ def test_agent() -> bool:
         return False
 
 
+async def _probe_status(settings: Settings) -> Tuple[Any, Any, Any]:
+    """Run the vLLM and tool status probes concurrently.
+    
+    Args:
+        settings: Configuration settings
+        
+    Returns:
+        Tuple of ``(healthy, model_info, tools_status)``; a probe that failed
+        is returned as its exception
+    """
+    from ..clients import AsyncVLLMClient
+    from ..tools import check_all_tools_status
+    
+    # run_in_executor rather than asyncio.to_thread, which needs Python 3.9
+    loop = asyncio.get_running_loop()
+    async with AsyncVLLMClient(settings) as client:
+        return tuple(await asyncio.gather(
+            client.health_check(),
+            client.get_model_info(),
+            loop.run_in_executor(None, functools.partial(check_all_tools_status, settings)),
+            return_exceptions=True,
+        ))
+
+
 def show_info() -> None:
     """Show system information."""
+    from rich.panel import Panel
+    from rich.table import Table
+    
     settings = get_settings()
     
+    # Probe everything up front so rendering never waits on the network
+    healthy, model_info, tools_status = asyncio.run(_probe_status(settings))
+    if isinstance(tools_status, BaseException):
+        raise tools_status
+    
     # Create info table
     table = Table(title="GPT-OSS Agent Information")
     table.add_column("Component", style="cyan")
@@ -116,12 +201,12 @@ def show_info() -> None:
     table.add_column("Details", style="white")
     
     # vLLM connection
-    try:
-        client = setup_vllm_client(wait_for_server=False)
-        model_info = get_model_info(settings)
+    if isinstance(model_info, BaseException):
+        table.add_row("vLLM Server", "❌ Error", str(model_info))
+    else:
         table.add_row(
             "vLLM Server",
-            "✅ Connected" if client.health_check() else "❌ Disconnected",
+            "✅ Connected" if healthy is True else "❌ Disconnected",
             f"{settings.vllm.base_url} ({settings.vllm.model})"
         )
         table.add_row(
@@ -129,11 +214,8 @@ def show_info() -> None:
             str(model_info.get("model_count", 0)),
             ", ".join(model_info.get("available_models", [])[:3])
         )
-    except Exception as e:
-        table.add_row("vLLM Server", "❌ Error", str(e))
     
     # Tools status
-    tools_status = check_all_tools_status(settings)
     table.add_row(
         "Tools Available",
         f"{tools_status['available_tools']}/{tools_status['total_tools']}",
@@ -165,8 +247,12 @@ def show_info() -> None:
         console.print(debug_panel)
 
 
-def main() -> None:
-    """Main CLI entry point."""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser.
+    
+    Returns:
+        Configured ArgumentParser
+    """
     parser = argparse.ArgumentParser(
         description="GPT-OSS Agent - AI agent for local GPT-OSS models",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -211,8 +297,17 @@ Examples:
         help="Set log level"
     )
     
+    return parser
+
+
+def main(args: Optional[argparse.Namespace] = None) -> None:
+    """Main CLI entry point.
     
-    args = parser.parse_args()
+    Args:
+        args: Already parsed arguments (parses ``sys.argv`` if None)
+    """
+    if args is None:
+        args = build_parser().parse_args()
     
     try:
         # Set up application
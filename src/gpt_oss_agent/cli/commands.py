@@ -1,28 +1,38 @@
 """Interactive CLI commands for GPT-OSS Agent."""
 
+import contextlib
+import functools
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Optional
 
-from rich.console import Console
-from rich.live import Live
-from rich.markdown import Markdown
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.prompt import Prompt
-from rich.spinner import Spinner
+from rich.text import Text
 
 from ..config import get_settings
 from ..core import create_agent
 from ..tools import get_available_tools, check_all_tools_status
 from ..exceptions import GPTOSSAgentError, EmptyResponseError
 
+if TYPE_CHECKING:
+    from rich.markdown import Markdown
+    from rich.status import Status
+
 
 console = Console()
 logger = logging.getLogger(__name__)
 
+# A few frames per second is smooth enough for a spinner and keeps
+# terminal output low during long model calls
+_SPINNER_REFRESH_PER_SECOND = 4
 
-def show_help() -> None:
-    """Show help information."""
-    help_text = """
+_USER_PROMPT = Text.from_markup("\n[bold cyan]You[/bold cyan]")
+
+_EXIT_COMMANDS = frozenset({'/quit', '/exit'})
+
+
+_HELP_TEXT = """
 # GPT-OSS Agent Commands
 
 - `/help` - Show this help message
@@ -32,8 +42,65 @@ def show_help() -> None:
 - `/quit` or `/exit` - Exit the application
 
 Just type your message to chat with the agent!
+"""
+
+# Static renderables are built once; Rich renderables can be printed repeatedly
+_WELCOME_PANEL = Panel(
+    "[bold green]🤖 GPT-OSS Agent[/bold green]\n"
+    "Type '/help' for commands, '/quit' to exit",
+    style="green"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _help_markdown() -> "Markdown":
+    """Build the help text renderable on first use.
+    
+    ``rich.markdown`` pulls in a Markdown parser, so it is only imported
+    when help is actually shown.
     """
-    console.print(Markdown(help_text))
+    from rich.markdown import Markdown
+    
+    return Markdown(_HELP_TEXT)
+
+
+def _create_thinking_status() -> Optional["Status"]:
+    """Create the spinner shown while the agent works.
+    
+    The status is created once per session and restarted for each message.
+    Outputs that are not terminals (pipes, CI logs) get no spinner.
+    """
+    if not console.is_terminal:
+        return None
+    return console.status(
+        "Thinking...",
+        spinner="dots",
+        refresh_per_second=_SPINNER_REFRESH_PER_SECOND,
+    )
+
+
+@contextlib.contextmanager
+def _thinking(status: Optional["Status"]) -> Iterator[None]:
+    """Show ``status`` for the duration of the block.
+    
+    Without a status a single plain line is printed instead of a stream of
+    escape sequences.
+    """
+    if status is None:
+        console.print("Thinking...", style="dim")
+        yield
+        return
+    
+    status.start()
+    try:
+        yield
+    finally:
+        status.stop()
+
+
+def show_help() -> None:
+    """Show help information."""
+    console.print(_help_markdown())
 
 
 def show_agent_info(agent) -> None:
@@ -101,11 +168,7 @@ def interactive_chat(model: Optional[str] = None) -> None:
     Args:
         model: Model to use (optional)
     """
-    console.print(Panel(
-        "[bold green]🤖 GPT-OSS Agent[/bold green]\n"
-        "Type '/help' for commands, '/quit' to exit",
-        style="green"
-    ))
+    console.print(_WELCOME_PANEL)
     
     try:
         # Get settings and tools
@@ -126,33 +189,39 @@ def interactive_chat(model: Optional[str] = None) -> None:
         console.print("Initializing agent...", style="dim")
         agent = create_agent(settings=settings, tools=tools)
         
-        console.print(f"✅ Agent ready! Using model: {settings.vllm.model}", style="green")
+        ready_lines = [Text(f"✅ Agent ready! Using model: {settings.vllm.model}", style="green")]
         if tools:
-            console.print(f"🔧 {len(tools)} tools available", style="dim")
+            ready_lines.append(Text(f"🔧 {len(tools)} tools available", style="dim"))
+        console.print(Group(*ready_lines))
+        
+        thinking_status = _create_thinking_status()
         
+        commands: Dict[str, Callable[[], None]] = {
+            '/help': show_help,
+            '/info': functools.partial(show_agent_info, agent),
+            '/tools': show_tools_status,
+            '/debug': show_debug_info,
+        }
         
         while True:
             try:
                 # Get user input
-                message = Prompt.ask("\n[bold cyan]You[/bold cyan]")
+                message = Prompt.ask(_USER_PROMPT)
+                stripped = message.strip()
                 
-                if not message.strip():
+                if not stripped:
                     continue
                 
-                # Handle commands
+                # Handle commands through the dispatch table
                 if message.startswith('/'):
-                    command = message.lower()
+                    command = stripped.lower()
                     
-                    if command in ['/quit', '/exit']:
+                    if command in _EXIT_COMMANDS:
                         break
-                    elif command == '/help':
-                        show_help()
-                    elif command == '/info':
-                        show_agent_info(agent)
-                    elif command == '/tools':
-                        show_tools_status()
-                    elif command == '/debug':
-                        show_debug_info()
+                    
+                    handler = commands.get(command)
+                    if handler is not None:
+                        handler()
                     else:
                         console.print(f"Unknown command: {message}", style="red")
                     continue
@@ -161,20 +230,25 @@ def interactive_chat(model: Optional[str] = None) -> None:
                 console.print("\n[bold green]Assistant[/bold green]")
                 
                 # Non-streaming response only
-                with Live(Spinner("dots", text="Thinking..."), refresh_per_second=10):
+                with _thinking(thinking_status):
                     response = agent.chat(message)
-                console.print(f"\n{response}")
+                # Print the response verbatim: skipping markup parsing and
+                # highlighting avoids regex passes over long answers and keeps
+                # bracketed model output (e.g. `arr[i]`) from being eaten
+                console.print("", response, sep="\n", markup=False, highlight=False)
             
             except EmptyResponseError as e:
-                console.print(f"\n⚠️  Empty response from agent: {e.message}", style="yellow")
+                lines = [Text(f"\n⚠️  Empty response from agent: {e.message}", style="yellow")]
                 if e.details:
-                    console.print(f"Details: {e.details}", style="dim yellow")
-                console.print("This may be a vLLM compatibility issue. Try rephrasing your question.", style="dim")
+                    lines.append(Text(f"Details: {e.details}", style="dim yellow"))
+                lines.append(Text("This may be a vLLM compatibility issue. Try rephrasing your question.", style="dim"))
+                console.print(Group(*lines))
             
             except GPTOSSAgentError as e:
-                console.print(f"\n❌ Agent error: {e.message}", style="red")
+                lines = [Text(f"\n❌ Agent error: {e.message}", style="red")]
                 if e.details:
-                    console.print(f"Details: {e.details}", style="dim red")
+                    lines.append(Text(f"Details: {e.details}", style="dim red"))
+                console.print(Group(*lines))
             
             except KeyboardInterrupt:
                 console.print("\n⏸️  Interrupted", style="yellow")
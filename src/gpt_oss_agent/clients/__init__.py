@@ -1,11 +1,38 @@
 """External service clients."""
 
-from .vllm import VLLMClient, setup_vllm_client, get_model_info
-from .exa import ExaSearchClient
+import importlib
+from typing import Any, List
+
+# Clients are imported on first access (PEP 562), so using one client does
+# not load the dependencies of the others.
+_LAZY_EXPORTS = {
+    "VLLMClient": ".vllm",
+    "AsyncVLLMClient": ".vllm",
+    "setup_vllm_client": ".vllm",
+    "get_model_info": ".vllm",
+    "create_async_openai_client": ".vllm",
+    "ExaSearchClient": ".exa",
+}
 
 __all__ = [
     "VLLMClient",
+    "AsyncVLLMClient",
     "setup_vllm_client", 
     "get_model_info",
+    "create_async_openai_client",
     "ExaSearchClient",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,16 +1,92 @@
 """Exa search API client for web search functionality."""
 
+import contextlib
+import importlib.util
 import logging
-from typing import Any, Dict, List, Optional
+import weakref
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional
 
-import requests
+import httpx
 
 from ..config import Settings, get_settings
 from ..exceptions import WebSearchError
+from ..utils.aio import LoopLocal
+from ..utils.http import response_excerpt
+from ..utils.serialization import loads
 
 
 logger = logging.getLogger(__name__)
 
+# Connection pool limits for the Exa API client
+EXA_POOL_LIMITS = httpx.Limits(max_keepalive_connections=4, max_connections=8)
+
+# Placeholder API key value that counts as "not configured"
+_PLACEHOLDER_API_KEY = "your_exa_api_key_here"
+
+# Characters of page text shown per search result
+SNIPPET_CHARS = 300
+
+# HTTP/2 lets concurrent tool calls share one connection (requires h2)
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _parse_response(response: httpx.Response, failure: str) -> Dict[str, Any]:
+    """Return the JSON body of a successful response or raise."""
+    if response.status_code == 200:
+        # Search responses with full page text can be hundreds of KB;
+        # orjson decodes them straight from bytes when it is installed
+        return loads(response.content)
+    raise WebSearchError(
+        f"{failure} with status {response.status_code}",
+        details=response_excerpt(response)
+    )
+
+
+def _result_snippet(result: Dict[str, Any]) -> str:
+    """Pick a search result's snippet from its text, highlights or summary."""
+    text = result.get("text")
+    if text:
+        return text[:SNIPPET_CHARS] + "..." if len(text) > SNIPPET_CHARS else text
+    
+    highlights = result.get("highlights")
+    if highlights:
+        return " ".join(highlights[:2])  # First 2 highlights
+    
+    return result.get("summary") or "No description available"
+
+
+@contextlib.contextmanager
+def _search_errors() -> Iterator[None]:
+    """Translate transport errors raised by a search request."""
+    try:
+        yield
+    except WebSearchError:
+        raise
+    except httpx.TimeoutException:
+        raise WebSearchError("Search request timed out")
+    except httpx.RequestError as e:
+        raise WebSearchError(f"Search request failed: {str(e)}")
+    except Exception as e:
+        logger.error(f"Unexpected error during search: {e}")
+        raise WebSearchError(f"Unexpected search error: {str(e)}")
+
+
+@contextlib.contextmanager
+def _content_errors() -> Iterator[None]:
+    """Translate transport errors raised by a content request."""
+    try:
+        yield
+    except WebSearchError:
+        raise
+    except httpx.TimeoutException:
+        raise WebSearchError("Content retrieval timed out")
+    except httpx.RequestError as e:
+        raise WebSearchError(f"Content retrieval failed: {str(e)}")
+    except Exception as e:
+        logger.error(f"Unexpected error during content retrieval: {e}")
+        raise WebSearchError(f"Unexpected content retrieval error: {str(e)}")
+
 
 class ExaSearchClient:
     """Client for Exa search API.
@@ -26,23 +102,156 @@ class ExaSearchClient:
             settings: Configuration settings (uses global if None)
         """
         self.settings = settings or get_settings()
-        self.api_key = self.settings.exa.api_key
+        exa_config = self.settings.exa
+        self.api_key = exa_config.api_key
         self.base_url = "https://api.exa.ai"
-        self.timeout = self.settings.exa.timeout
-        self.enabled = self.settings.exa.enabled and bool(self.api_key)
+        self.timeout = exa_config.timeout
+        self.max_results = exa_config.max_results
+        self.enabled = exa_config.enabled and bool(self.api_key)
+        
+        # Configuration is fixed after init, so availability is decided once
+        self._api_key_configured = bool(self.api_key) and self.api_key != _PLACEHOLDER_API_KEY
+        self._available = self.enabled and self._api_key_configured
+        
+        # Request headers never change after init; both HTTP clients share them
+        self._headers: Mapping[str, str] = MappingProxyType({
+            "accept": "application/json",
+            "content-type": "application/json",
+            "x-api-key": self.api_key or "",
+        })
+        
+        # Created on first request so disabled clients never open a pool
+        self._http: Optional[httpx.Client] = None
+        # Async connections belong to the loop that opened them, so there is
+        # one async client per event loop, closed when that loop shuts down
+        self._async_http: LoopLocal[httpx.AsyncClient] = LoopLocal(
+            lambda: httpx.AsyncClient(**self._client_options()),
+            httpx.AsyncClient.aclose,
+        )
         
         if not self.enabled:
             logger.warning("Exa search client disabled - no API key configured")
         else:
             logger.info("Exa search client initialized")
     
+    def __enter__(self) -> "ExaSearchClient":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close the pooled sync HTTP client."""
+        if self._http is not None:
+            self._http_finalizer()
+            self._http = None
+    
+    async def aclose(self) -> None:
+        """Close the sync client and the running loop's async client."""
+        self.close()
+        await self._async_http.aclose()
+    
+    def _client_options(self) -> Dict[str, Any]:
+        """Keyword arguments shared by the sync and async HTTP clients."""
+        return {
+            "base_url": self.base_url,
+            "headers": self._headers,
+            "timeout": self.timeout,
+            "limits": EXA_POOL_LIMITS,
+            "http2": _HTTP2_AVAILABLE,
+        }
+    
+    def _get_http(self) -> httpx.Client:
+        """Return the pooled HTTP client, creating it on first use.
+        
+        Searches and content requests share its keep-alive connections,
+        so only the first request pays for DNS and the TLS handshake.
+        """
+        if self._http is None:
+            self._http = httpx.Client(**self._client_options())
+            # Closes the pool at garbage collection or exit if close() is
+            # never called, without keeping this client alive
+            self._http_finalizer = weakref.finalize(self, self._http.close)
+        return self._http
+    
+    async def _get_async_http(self) -> httpx.AsyncClient:
+        """Return the pooled async HTTP client for the running event loop."""
+        return await self._async_http.get()
+    
     def is_available(self) -> bool:
         """Check if Exa search is available.
         
         Returns:
             True if API key is configured and client is enabled
         """
-        return self.enabled and bool(self.api_key) and self.api_key != "your_exa_api_key_here"
+        return self._available
+    
+    def _check_available(self) -> None:
+        """Raise if the client cannot make requests."""
+        if not self.is_available():
+            raise WebSearchError(
+                "Exa search not available",
+                details="API key not configured or client disabled"
+            )
+    
+    def _search_payload(
+        self,
+        query: str,
+        num_results: Optional[int],
+        include_domains: Optional[List[str]],
+        exclude_domains: Optional[List[str]],
+        use_autoprompt: bool,
+        include_text: bool,
+        include_highlights: bool,
+        include_summary: bool
+    ) -> Dict[str, Any]:
+        """Validate search arguments and build the ``/search`` payload."""
+        self._check_available()
+        
+        if not query or not query.strip():
+            raise WebSearchError("Search query cannot be empty")
+        
+        num_results = num_results or self.max_results
+        if num_results < 1 or num_results > 10:
+            num_results = 5
+        
+        payload = {
+            "query": query,
+            "numResults": num_results,
+            "useAutoprompt": use_autoprompt,
+            "contents": {
+                "text": include_text,
+                "highlights": include_highlights,
+                "summary": include_summary
+            }
+        }
+        
+        if include_domains:
+            payload["includeDomains"] = include_domains
+        if exclude_domains:
+            payload["excludeDomains"] = exclude_domains
+        
+        return payload
+    
+    def _content_payload(
+        self,
+        urls: List[str],
+        include_text: bool,
+        include_summary: bool
+    ) -> Dict[str, Any]:
+        """Validate content arguments and build the ``/contents`` payload."""
+        self._check_available()
+        
+        if not urls or not all(urls):
+            raise WebSearchError("URL cannot be empty")
+        
+        return {
+            "ids": list(urls),
+            "contents": {
+                "text": include_text,
+                "summary": include_summary
+            }
+        }
     
     def search(
         self,
@@ -73,64 +282,97 @@ class ExaSearchClient:
         Raises:
             WebSearchError: If search fails or client not available
         """
-        if not self.is_available():
-            raise WebSearchError(
-                "Exa search not available",
-                details="API key not configured or client disabled"
-            )
+        payload = self._search_payload(
+            query, num_results, include_domains, exclude_domains,
+            use_autoprompt, include_text, include_highlights, include_summary
+        )
         
-        if not query or not query.strip():
-            raise WebSearchError("Search query cannot be empty")
+        with _search_errors():
+            response = self._get_http().post("/search", json=payload)
+            return _parse_response(response, "Search request failed")
+    
+    async def asearch(
+        self,
+        query: str,
+        num_results: int = None,
+        include_domains: Optional[List[str]] = None,
+        exclude_domains: Optional[List[str]] = None,
+        use_autoprompt: bool = True,
+        include_text: bool = True,
+        include_highlights: bool = True,
+        include_summary: bool = True
+    ) -> Dict[str, Any]:
+        """Search the web using Exa API without blocking the event loop.
         
-        num_results = num_results or self.settings.exa.max_results
-        if num_results < 1 or num_results > 10:
-            num_results = 5
+        Takes the same arguments as :meth:`search`, so several searches can
+        be awaited together with ``asyncio.gather``.
         
-        try:
-            headers = {
-                "accept": "application/json",
-                "content-type": "application/json",
-                "x-api-key": self.api_key
-            }
+        Returns:
+            Dictionary containing search results
             
-            payload = {
-                "query": query,
-                "numResults": num_results,
-                "useAutoprompt": use_autoprompt,
-                "contents": {
-                    "text": include_text,
-                    "highlights": include_highlights,
-                    "summary": include_summary
-                }
-            }
+        Raises:
+            WebSearchError: If search fails or client not available
+        """
+        payload = self._search_payload(
+            query, num_results, include_domains, exclude_domains,
+            use_autoprompt, include_text, include_highlights, include_summary
+        )
+        
+        with _search_errors():
+            http = await self._get_async_http()
+            response = await http.post("/search", json=payload)
+            return _parse_response(response, "Search request failed")
+    
+    def get_contents(
+        self,
+        urls: List[str],
+        include_text: bool = True,
+        include_summary: bool = True
+    ) -> Dict[str, Any]:
+        """Get content from several webpages with a single request.
+        
+        Args:
+            urls: URLs of the webpages to retrieve
+            include_text: Include full text content
+            include_summary: Include summary
             
-            if include_domains:
-                payload["includeDomains"] = include_domains
-            if exclude_domains:
-                payload["excludeDomains"] = exclude_domains
+        Returns:
+            Dictionary containing page content, one result per found URL
             
-            response = requests.post(
-                f"{self.base_url}/search",
-                headers=headers,
-                json=payload,
-                timeout=self.timeout
-            )
+        Raises:
+            WebSearchError: If content retrieval fails
+        """
+        payload = self._content_payload(urls, include_text, include_summary)
+        
+        with _content_errors():
+            response = self._get_http().post("/contents", json=payload)
+            return _parse_response(response, "Content retrieval failed")
+    
+    async def aget_contents(
+        self,
+        urls: List[str],
+        include_text: bool = True,
+        include_summary: bool = True
+    ) -> Dict[str, Any]:
+        """Get content from several webpages without blocking the event loop.
+        
+        Args:
+            urls: URLs of the webpages to retrieve
+            include_text: Include full text content
+            include_summary: Include summary
             
-            if response.status_code == 200:
-                return response.json()
-            else:
-                raise WebSearchError(
-                    f"Search request failed with status {response.status_code}",
-                    details=response.text
-                )
-                
-        except requests.exceptions.Timeout:
-            raise WebSearchError("Search request timed out")
-        except requests.exceptions.RequestException as e:
-            raise WebSearchError(f"Search request failed: {str(e)}")
-        except Exception as e:
-            logger.error(f"Unexpected error during search: {e}")
-            raise WebSearchError(f"Unexpected search error: {str(e)}")
+        Returns:
+            Dictionary containing page content, one result per found URL
+            
+        Raises:
+            WebSearchError: If content retrieval fails
+        """
+        payload = self._content_payload(urls, include_text, include_summary)
+        
+        with _content_errors():
+            http = await self._get_async_http()
+            response = await http.post("/contents", json=payload)
+            return _parse_response(response, "Content retrieval failed")
     
     def get_content(
         self,
@@ -151,52 +393,28 @@ class ExaSearchClient:
         Raises:
             WebSearchError: If content retrieval fails
         """
-        if not self.is_available():
-            raise WebSearchError(
-                "Exa search not available",
-                details="API key not configured or client disabled"
-            )
-        
-        if not url:
-            raise WebSearchError("URL cannot be empty")
+        return self.get_contents([url], include_text, include_summary)
+    
+    async def aget_content(
+        self,
+        url: str,
+        include_text: bool = True,
+        include_summary: bool = True
+    ) -> Dict[str, Any]:
+        """Get content from a specific webpage without blocking the event loop.
         
-        try:
-            headers = {
-                "accept": "application/json",
-                "content-type": "application/json",
-                "x-api-key": self.api_key
-            }
-            
-            payload = {
-                "ids": [url],
-                "contents": {
-                    "text": include_text,
-                    "summary": include_summary
-                }
-            }
+        Args:
+            url: URL of the webpage to retrieve
+            include_text: Include full text content
+            include_summary: Include summary
             
-            response = requests.post(
-                f"{self.base_url}/contents",
-                headers=headers,
-                json=payload,
-                timeout=self.timeout
-            )
+        Returns:
+            Dictionary containing page content
             
-            if response.status_code == 200:
-                return response.json()
-            else:
-                raise WebSearchError(
-                    f"Content retrieval failed with status {response.status_code}",
-                    details=response.text
-                )
-                
-        except requests.exceptions.Timeout:
-            raise WebSearchError("Content retrieval timed out")
-        except requests.exceptions.RequestException as e:
-            raise WebSearchError(f"Content retrieval failed: {str(e)}")
-        except Exception as e:
-            logger.error(f"Unexpected error during content retrieval: {e}")
-            raise WebSearchError(f"Unexpected content retrieval error: {str(e)}")
+        Raises:
+            WebSearchError: If content retrieval fails
+        """
+        return await self.aget_contents([url], include_text, include_summary)
     
     def format_search_results(self, results: Dict[str, Any], query: str) -> str:
         """Format search results into a readable string.
@@ -211,29 +429,16 @@ class ExaSearchClient:
         if "error" in results:
             return f"Search error: {results['error']}"
         
-        formatted_results = []
-        formatted_results.append(f"Web search results for: '{query}'")
-        formatted_results.append("=" * 50)
-        
-        if "results" in results and results["results"]:
-            for i, result in enumerate(results["results"], 1):
-                title = result.get("title", "No title")
-                url = result.get("url", "No URL")
-                
-                # Get snippet from text, highlights, or summary
-                snippet = ""
-                if "text" in result and result["text"]:
-                    snippet = result["text"][:300] + "..." if len(result["text"]) > 300 else result["text"]
-                elif "highlights" in result and result["highlights"]:
-                    snippet = " ".join(result["highlights"][:2])  # First 2 highlights
-                elif "summary" in result and result["summary"]:
-                    snippet = result["summary"]
-                else:
-                    snippet = "No description available"
-                
-                formatted_results.append(f"\n{i}. {title}")
-                formatted_results.append(f"   URL: {url}")
-                formatted_results.append(f"   {snippet}")
+        formatted_results = [f"Web search results for: '{query}'", "=" * 50]
+        
+        entries = results.get("results")
+        if entries:
+            formatted_results.extend(
+                f"\n{i}. {result.get('title', 'No title')}\n"
+                f"   URL: {result.get('url', 'No URL')}\n"
+                f"   {_result_snippet(result)}"
+                for i, result in enumerate(entries, 1)
+            )
         else:
             formatted_results.append("No results found for this query.")
         
@@ -282,8 +487,8 @@ class ExaSearchClient:
         """
         return {
             "enabled": self.enabled,
-            "api_key_configured": bool(self.api_key and self.api_key != "your_exa_api_key_here"),
+            "api_key_configured": self._api_key_configured,
             "base_url": self.base_url,
             "timeout": self.timeout,
-            "max_results": self.settings.exa.max_results,
+            "max_results": self.max_results,
         }
\ No newline at end of file
@@ -1,28 +1,115 @@
 """vLLM client for connecting to local GPT-OSS model server."""
 
+import asyncio
 import logging
+import random
 import time
-from typing import Any, Dict, Optional
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
 import httpx
-from openai import OpenAI
 
 from ..config import Settings, get_settings, setup_openai_env
 from ..exceptions import VLLMConnectionError, VLLMServerError
+from ..utils.http import response_excerpt
+
+# The OpenAI SDK is slow to import, so it is loaded when a client is built
+if TYPE_CHECKING:
+    import openai
+    from openai import AsyncOpenAI, OpenAI
 
 
 logger = logging.getLogger(__name__)
 
+# Connection pool limits for the async client shared by agent runs
+ASYNC_POOL_LIMITS = httpx.Limits(max_keepalive_connections=64, max_connections=128)
 
-class VLLMClient:
-    """Client for connecting to vLLM server.
+# Connection pool limits for the sync client used for probes and the SDK
+SYNC_POOL_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+
+# Seconds model information is reused before the server is queried again
+MODEL_INFO_TTL = 60.0
+
+# Clients reused by the module-level get_model_info, keyed by
+# (base_url, configured model); each keeps its own model info cache
+_shared_clients: Dict[Tuple[str, str], "VLLMClient"] = {}
+
+
+def _build_model_info(
+    response: httpx.Response,
+    base_url: str,
+    configured_model: str
+) -> Dict[str, Any]:
+    """Build the model information dictionary from a ``/models`` response."""
+    models = response.json().get('data', [])
     
-    This client manages the connection to a locally-hosted vLLM server
-    and provides health checking and model information retrieval.
+    return {
+        "base_url": base_url,
+        "available_models": [model.get('id', 'unknown') for model in models],
+        "configured_model": configured_model,
+        "model_count": len(models),
+        "server_healthy": True,
+        # One /completions request accepts a list of prompts; chat prompts
+        # are sent as concurrent requests instead (see batch_chat)
+        "supports_batch_completions": True,
+    }
+
+
+def _backoff_delays(max_wait: float, check_interval: float, max_interval: float) -> Iterator[float]:
+    """Yield the pauses between health checks until ``max_wait`` has passed.
+    
+    Delays start at ``check_interval`` and double up to ``max_interval``,
+    with +/-20% jitter so several clients starting together do not poll in
+    lockstep. The last pause is cut short at the deadline.
+    """
+    deadline = time.monotonic() + max_wait
+    
+    def delays() -> Iterator[float]:
+        delay = check_interval
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            yield min(remaining, delay * random.uniform(0.8, 1.2))
+            delay = min(max_interval, delay * 2)
+    
+    return delays()
+
+
+def _choice_texts(response: Any) -> List[str]:
+    """Return completion texts ordered by choice index.
+    
+    With ``n`` completions per prompt the choices for prompt ``i`` occupy
+    indices ``i * n`` to ``i * n + n - 1``.
+    """
+    return [choice.text for choice in sorted(response.choices, key=lambda c: c.index)]
+
+
+def _wrap_openai_error(error: "openai.OpenAIError") -> Exception:
+    """Translate an OpenAI SDK error into the matching vLLM exception."""
+    import openai
+    
+    if isinstance(error, openai.APIConnectionError):
+        return VLLMConnectionError(f"Connection error during batch completion: {error}")
+    if isinstance(error, openai.APIStatusError):
+        return VLLMServerError(
+            f"Batch completion failed: HTTP {error.status_code}",
+            status_code=error.status_code,
+            details=str(error)
+        )
+    return VLLMServerError(f"Batch completion failed: {error}")
+
+
+class _VLLMClientBase:
+    """State and response handling shared by the sync and async clients.
+    
+    Subclasses only perform the HTTP requests; building URLs, interpreting
+    ``/models`` responses, the model info cache and the backoff schedule
+    live here.
     """
     
     def __init__(self, settings: Optional[Settings] = None):
-        """Initialize vLLM client.
+        """Initialize shared client state.
         
         Args:
             settings: Configuration settings (uses global if None)
@@ -31,25 +118,167 @@ class VLLMClient:
         self.base_url = self.settings.vllm.base_url
         self.timeout = self.settings.vllm.timeout
         self.max_retries = self.settings.vllm.max_retries
+        # Health checks and model queries both hit the models endpoint
+        self._models_url = f"{self.base_url.rstrip('/')}/models"
+        
+        self._model_info: Optional[Dict[str, Any]] = None
+        self._model_info_expires = 0.0
+    
+    def _cached_model_info(self, refresh: bool) -> Optional[Dict[str, Any]]:
+        """Return the cached model info if it is still fresh."""
+        if not refresh and self._model_info is not None and time.monotonic() < self._model_info_expires:
+            return self._model_info
+        return None
+    
+    def _cache_model_info(self, response: httpx.Response) -> Optional[Dict[str, Any]]:
+        """Store model info parsed from a ``/models`` response.
+        
+        Health checks query the same endpoint, so a successful check also
+        refreshes the model info cache and ``get_model_info`` needs no request.
+        
+        Returns:
+            The model information, or None if the body could not be parsed
+        """
+        try:
+            info = _build_model_info(response, self.base_url, self.settings.vllm.model)
+        except (ValueError, AttributeError):
+            logger.debug("Could not parse model list from %s", self.base_url)
+            return None
+        
+        self._model_info = info
+        self._model_info_expires = time.monotonic() + MODEL_INFO_TTL
+        return info
+    
+    def _probe_response(self, response: httpx.Response) -> Optional[str]:
+        """Interpret a health check response.
+        
+        Returns:
+            None if the server is healthy, otherwise a failure description
+        """
+        if response.status_code == 200:
+            self._cache_model_info(response)
+            return None
+        return f"vLLM health check failed: HTTP {response.status_code}"
+    
+    def _probe_error(self, error: Exception, timeout: float) -> str:
+        """Describe a health check request that raised ``error``."""
+        if isinstance(error, httpx.TimeoutException):
+            return f"vLLM health check timed out after {timeout}s"
+        if isinstance(error, httpx.ConnectError):
+            return f"Cannot connect to vLLM server at {self.base_url}"
+        return f"vLLM health check failed: {error}"
+    
+    def _report_health(self, failure: Optional[str]) -> bool:
+        """Log the outcome of a health check and return whether it passed."""
+        if failure is None:
+            logger.debug("vLLM server health check passed")
+            return True
+        
+        logger.warning(failure)
+        return False
+    
+    def _model_info_response(self, response: httpx.Response) -> Dict[str, Any]:
+        """Cache and return the model info from a ``/models`` response.
+        
+        Raises:
+            VLLMServerError: If the response is an error or cannot be parsed
+        """
+        if response.status_code != 200:
+            raise VLLMServerError(
+                f"Failed to get model info: HTTP {response.status_code}",
+                status_code=response.status_code,
+                details=response_excerpt(response)
+            )
+        
+        model_info = self._cache_model_info(response)
+        if model_info is None:
+            raise VLLMServerError("Invalid model list response", details=response_excerpt(response))
+        return model_info
+    
+    @staticmethod
+    def _model_info_error(error: Exception) -> Exception:
+        """Translate an exception raised while requesting the model list."""
+        if isinstance(error, httpx.RequestError):
+            return VLLMConnectionError(f"Connection error getting model info: {error}")
+        return VLLMServerError(f"Unexpected error getting model info: {error}")
+    
+    def _connection_result(self) -> Dict[str, Any]:
+        """Return the initial ``test_connection`` result."""
+        return {
+            "server_url": self.base_url,
+            "configured_model": self.settings.vllm.model,
+            "health_check_passed": False,
+            "model_info_available": False,
+            "error": None
+        }
+    
+    def _wait_failed(self, failure: str, attempt: int, delay: Optional[float], max_wait: float) -> None:
+        """Log a failed probe while waiting for the server.
+        
+        Raises:
+            VLLMConnectionError: If the wait deadline has passed (``delay`` is None)
+        """
+        if delay is None:
+            raise VLLMConnectionError(
+                f"vLLM server at {self.base_url} did not become available within {max_wait}s"
+            )
+        
+        # Report the first failure, keep the rest out of the default log
+        if attempt == 0:
+            logger.info("vLLM server not ready yet (%s), retrying with backoff", failure)
+        else:
+            logger.debug("%s, retrying in %.1fs", failure, delay)
+
+
+class VLLMClient(_VLLMClientBase):
+    """Client for connecting to vLLM server.
+    
+    This client manages the connection to a locally-hosted vLLM server
+    and provides health checking and model information retrieval.
+    """
+    
+    def __init__(self, settings: Optional[Settings] = None):
+        """Initialize vLLM client.
+        
+        Args:
+            settings: Configuration settings (uses global if None)
+        """
+        super().__init__(settings)
         
         # Set up OpenAI environment variables for SDK compatibility
         setup_openai_env(self.settings)
         
+        # One pooled HTTP client serves health checks, model queries and the
+        # OpenAI SDK, so repeated calls reuse keep-alive connections
+        self._http = httpx.Client(timeout=self.timeout, limits=SYNC_POOL_LIMITS)
+        # Release pooled sockets for clients that are never closed, when
+        # they are garbage collected or at exit. The finalizer only holds
+        # the httpx client, so it does not keep this client alive.
+        self._finalizer = weakref.finalize(self, self._http.close)
+        
+        from openai import OpenAI
+        
         # Create OpenAI client configured for vLLM
         self.openai_client = OpenAI(
             base_url=self.base_url,
             api_key="dummy",  # Required by OpenAI SDK but not used by vLLM
             timeout=self.timeout,
             max_retries=self.max_retries,
+            http_client=self._http,
         )
         
-        # Force update environment for OpenAI Agents SDK compatibility
-        import os
-        os.environ['OPENAI_BASE_URL'] = self.base_url
-        os.environ['OPENAI_API_KEY'] = "dummy"
-        
         logger.info(f"vLLM client initialized for {self.base_url}")
     
+    def __enter__(self) -> "VLLMClient":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close the pooled HTTP client."""
+        self._finalizer()
+    
     def health_check(self, timeout: Optional[int] = None) -> bool:
         """Check if vLLM server is healthy.
         
@@ -59,123 +288,115 @@ class VLLMClient:
         Returns:
             True if server is healthy, False otherwise
         """
-        timeout = timeout or self.timeout
+        return self._report_health(self._probe(timeout or self.timeout))
+    
+    def _probe(self, timeout: float) -> Optional[str]:
+        """Probe the models endpoint once.
         
+        Args:
+            timeout: Request timeout in seconds
+            
+        Returns:
+            None if the server is healthy, otherwise a failure description
+        """
         try:
-            # Try to get models endpoint
-            with httpx.Client(timeout=timeout) as client:
-                response = client.get(f"{self.base_url}/models")
-                
-                if response.status_code == 200:
-                    logger.debug("vLLM server health check passed")
-                    return True
-                else:
-                    logger.warning(f"vLLM health check failed: HTTP {response.status_code}")
-                    return False
-                    
-        except httpx.TimeoutException:
-            logger.warning(f"vLLM health check timed out after {timeout}s")
-            return False
-        except httpx.ConnectError:
-            logger.warning(f"Cannot connect to vLLM server at {self.base_url}")
-            return False
+            response = self._http.get(self._models_url, timeout=timeout)
         except Exception as e:
-            logger.warning(f"vLLM health check failed: {e}")
-            return False
+            return self._probe_error(e, timeout)
+        return self._probe_response(response)
     
-    def wait_for_server(self, max_wait: int = 60, check_interval: int = 2) -> bool:
+    def wait_for_server(
+        self,
+        max_wait: int = 60,
+        check_interval: float = 0.1,
+        max_interval: float = 2.0
+    ) -> bool:
         """Wait for vLLM server to become available.
         
+        The delay between health checks starts at ``check_interval`` and
+        doubles after each failure up to ``max_interval``, with +/-20% jitter
+        so several clients starting together do not poll in lockstep. A
+        server that comes up is noticed within about ``max_interval`` seconds.
+        
         Args:
             max_wait: Maximum time to wait in seconds
-            check_interval: Time between health checks in seconds
+            check_interval: Initial time between health checks in seconds
+            max_interval: Upper bound for the time between health checks
             
         Returns:
-            True if server becomes available, False if timeout
+            True if server becomes available
             
         Raises:
             VLLMConnectionError: If server doesn't become available within max_wait
         """
         logger.info(f"Waiting for vLLM server at {self.base_url}")
         
-        start_time = time.time()
-        while time.time() - start_time < max_wait:
-            if self.health_check(timeout=5):
+        delays = _backoff_delays(max_wait, check_interval, max_interval)
+        attempt = 0
+        while True:
+            failure = self._probe(timeout=5)
+            if failure is None:
                 logger.info("vLLM server is ready")
                 return True
             
-            logger.debug(f"vLLM server not ready, waiting {check_interval}s...")
-            time.sleep(check_interval)
-        
-        raise VLLMConnectionError(
-            f"vLLM server at {self.base_url} did not become available within {max_wait}s"
-        )
+            delay = next(delays, None)
+            self._wait_failed(failure, attempt, delay, max_wait)
+            time.sleep(delay)
+            attempt += 1
     
-    def get_model_info(self) -> Dict[str, Any]:
+    def get_model_info(self, refresh: bool = False) -> Dict[str, Any]:
         """Get information about available models.
         
+        The model list of a running server rarely changes, so results are
+        reused for ``MODEL_INFO_TTL`` seconds.
+        
+        Args:
+            refresh: Query the server even if a cached result is available
+        
         Returns:
             Dictionary with model information
             
         Raises:
             VLLMServerError: If unable to get model info
         """
+        cached = self._cached_model_info(refresh)
+        if cached is not None:
+            return cached
+        
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(f"{self.base_url}/models")
-                
-                if response.status_code != 200:
-                    raise VLLMServerError(
-                        f"Failed to get model info: HTTP {response.status_code}",
-                        status_code=response.status_code,
-                        details=response.text
-                    )
-                
-                data = response.json()
-                models = data.get('data', [])
-                
-                return {
-                    "base_url": self.base_url,
-                    "available_models": [model.get('id', 'unknown') for model in models],
-                    "configured_model": self.settings.vllm.model,
-                    "model_count": len(models),
-                    "server_healthy": True
-                }
-                
-        except httpx.HTTPStatusError as e:
-            raise VLLMServerError(
-                f"HTTP error getting model info: {e.response.status_code}",
-                status_code=e.response.status_code
-            )
-        except httpx.RequestError as e:
-            raise VLLMConnectionError(f"Connection error getting model info: {e}")
+            response = self._http.get(self._models_url)
         except Exception as e:
-            raise VLLMServerError(f"Unexpected error getting model info: {e}")
+            raise self._model_info_error(e) from e
+        return self._model_info_response(response)
     
-    def test_connection(self) -> Dict[str, Any]:
+    def test_connection(self, cheap: bool = True) -> Dict[str, Any]:
         """Test the connection to vLLM server.
         
+        The health check fetches the model list, so the model info comes from
+        that same response. Unless ``cheap`` is False no generation is run.
+        
+        Args:
+            cheap: Skip the one-token completion that exercises the model
+        
         Returns:
             Dictionary with connection test results
         """
-        result = {
-            "server_url": self.base_url,
-            "configured_model": self.settings.vllm.model,
-            "health_check_passed": False,
-            "model_info_available": False,
-            "error": None
-        }
+        result = self._connection_result()
         
         try:
             # Test health check
             result["health_check_passed"] = self.health_check()
             
             if result["health_check_passed"]:
-                # Test model info
+                # Served from the health check response
                 model_info = self.get_model_info()
                 result["model_info_available"] = True
                 result["available_models"] = model_info["available_models"]
                 result["model_count"] = model_info["model_count"]
+                
+                if not cheap:
+                    self.batch_complete(["ping"], max_tokens=1)
+                    result["completion_passed"] = True
             
         except Exception as e:
             result["error"] = str(e)
@@ -183,7 +404,40 @@ class VLLMClient:
         
         return result
     
-    def get_openai_client(self) -> OpenAI:
+    def batch_complete(self, prompts: List[str], **kwargs) -> List[str]:
+        """Complete several prompts with a single ``/completions`` request.
+        
+        vLLM schedules every prompt in the list together, which is much
+        faster than one request per prompt.
+        
+        Args:
+            prompts: Prompts to complete
+            **kwargs: Additional completion parameters (e.g. ``max_tokens``)
+            
+        Returns:
+            Completion texts in prompt order
+            
+        Raises:
+            VLLMConnectionError: If the server cannot be reached
+            VLLMServerError: If the server rejects the request
+        """
+        import openai
+        
+        if not prompts:
+            return []
+        
+        try:
+            response = self.openai_client.completions.create(
+                model=self.settings.vllm.model,
+                prompt=prompts,
+                **kwargs
+            )
+        except openai.OpenAIError as e:
+            raise _wrap_openai_error(e) from e
+        
+        return _choice_texts(response)
+    
+    def get_openai_client(self) -> "OpenAI":
         """Get configured OpenAI client for vLLM.
         
         Returns:
@@ -192,12 +446,237 @@ class VLLMClient:
         return self.openai_client
 
 
+class AsyncVLLMClient(_VLLMClientBase):
+    """Async client for connecting to vLLM server.
+    
+    Mirrors :class:`VLLMClient` for use inside an event loop. A single
+    pooled ``httpx.AsyncClient`` is created up front and reused for every
+    request, so concurrent probes share keep-alive connections instead of
+    blocking the loop or opening a new connection each.
+    """
+    
+    def __init__(self, settings: Optional[Settings] = None):
+        """Initialize async vLLM client.
+        
+        Args:
+            settings: Configuration settings (uses global if None)
+        """
+        super().__init__(settings)
+        
+        self._http = httpx.AsyncClient(timeout=self.timeout, limits=ASYNC_POOL_LIMITS)
+        self.openai_client = create_async_openai_client(self.settings)
+        
+        logger.info("Async vLLM client initialized for %s", self.base_url)
+    
+    async def __aenter__(self) -> "AsyncVLLMClient":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP clients."""
+        await self._http.aclose()
+        await self.openai_client.close()
+    
+    async def health_check(self, timeout: Optional[int] = None) -> bool:
+        """Check if vLLM server is healthy.
+        
+        Args:
+            timeout: Request timeout in seconds
+            
+        Returns:
+            True if server is healthy, False otherwise
+        """
+        return self._report_health(await self._probe(timeout or self.timeout))
+        
+    async def _probe(self, timeout: float) -> Optional[str]:
+        """Probe the models endpoint once without blocking the loop.
+        
+        Args:
+            timeout: Request timeout in seconds
+        
+        Returns:
+            None if the server is healthy, otherwise a failure description
+        """
+        try:
+            response = await self._http.get(self._models_url, timeout=timeout)
+        except Exception as e:
+            return self._probe_error(e, timeout)
+        return self._probe_response(response)
+            
+    async def wait_for_server(
+        self,
+        max_wait: int = 60,
+        check_interval: float = 0.1,
+        max_interval: float = 2.0
+    ) -> bool:
+        """Wait for vLLM server to become available.
+        
+        Uses the same backoff schedule as :meth:`VLLMClient.wait_for_server`
+        but sleeps without blocking the event loop.
+        
+        Args:
+            max_wait: Maximum time to wait in seconds
+            check_interval: Initial time between health checks in seconds
+            max_interval: Upper bound for the time between health checks
+        
+        Returns:
+            True if server becomes available
+        
+        Raises:
+            VLLMConnectionError: If server doesn't become available within max_wait
+        """
+        logger.info("Waiting for vLLM server at %s", self.base_url)
+        
+        delays = _backoff_delays(max_wait, check_interval, max_interval)
+        attempt = 0
+        while True:
+            failure = await self._probe(timeout=5)
+            if failure is None:
+                logger.info("vLLM server is ready")
+                return True
+            
+            delay = next(delays, None)
+            self._wait_failed(failure, attempt, delay, max_wait)
+            await asyncio.sleep(delay)
+            attempt += 1
+    
+    async def get_model_info(self, refresh: bool = False) -> Dict[str, Any]:
+        """Get information about available models.
+        
+        Results are reused for ``MODEL_INFO_TTL`` seconds.
+        
+        Args:
+            refresh: Query the server even if a cached result is available
+        
+        Returns:
+            Dictionary with model information
+            
+        Raises:
+            VLLMServerError: If unable to get model info
+        """
+        cached = self._cached_model_info(refresh)
+        if cached is not None:
+            return cached
+        
+        try:
+            response = await self._http.get(self._models_url)
+        except Exception as e:
+            raise self._model_info_error(e) from e
+        return self._model_info_response(response)
+    
+    async def test_connection(self, cheap: bool = True) -> Dict[str, Any]:
+        """Test the connection to vLLM server.
+        
+        Args:
+            cheap: Skip the one-token completion that exercises the model
+        
+        Returns:
+            Dictionary with connection test results
+        """
+        result = self._connection_result()
+        
+        try:
+            result["health_check_passed"] = await self.health_check()
+            
+            if result["health_check_passed"]:
+                model_info = await self.get_model_info()
+                result["model_info_available"] = True
+                result["available_models"] = model_info["available_models"]
+                result["model_count"] = model_info["model_count"]
+                
+                if not cheap:
+                    await self.batch_complete(["ping"], max_tokens=1)
+                    result["completion_passed"] = True
+        
+        except Exception as e:
+            result["error"] = str(e)
+            logger.error("Connection test failed: %s", e)
+        
+        return result
+    
+    async def batch_complete(self, prompts: List[str], **kwargs) -> List[str]:
+        """Complete several prompts with a single ``/completions`` request.
+        
+        Args:
+            prompts: Prompts to complete
+            **kwargs: Additional completion parameters (e.g. ``max_tokens``)
+            
+        Returns:
+            Completion texts in prompt order
+            
+        Raises:
+            VLLMConnectionError: If the server cannot be reached
+            VLLMServerError: If the server rejects the request
+        """
+        import openai
+        
+        if not prompts:
+            return []
+        
+        try:
+            response = await self.openai_client.completions.create(
+                model=self.settings.vllm.model,
+                prompt=prompts,
+                **kwargs
+            )
+        except openai.OpenAIError as e:
+            raise _wrap_openai_error(e) from e
+        
+        return _choice_texts(response)
+    
+    async def batch_chat(self, prompts: List[str], **kwargs) -> List[str]:
+        """Send several single-turn chat prompts concurrently.
+        
+        The chat API takes one conversation per request, so the requests are
+        issued together over the pooled connection and batched server-side.
+        
+        Args:
+            prompts: User messages, one conversation each
+            **kwargs: Additional chat completion parameters
+            
+        Returns:
+            Assistant replies in prompt order
+            
+        Raises:
+            VLLMConnectionError: If the server cannot be reached
+            VLLMServerError: If the server rejects a request
+        """
+        import openai
+        
+        async def complete_one(prompt: str) -> str:
+            response = await self.openai_client.chat.completions.create(
+                model=self.settings.vllm.model,
+                messages=[{"role": "user", "content": prompt}],
+                **kwargs
+            )
+            return response.choices[0].message.content or ""
+        
+        try:
+            return list(await asyncio.gather(*(complete_one(p) for p in prompts)))
+        except openai.OpenAIError as e:
+            raise _wrap_openai_error(e) from e
+    
+    def get_openai_client(self) -> "AsyncOpenAI":
+        """Get configured async OpenAI client for vLLM.
+        
+        Returns:
+            AsyncOpenAI client configured for vLLM
+        """
+        return self.openai_client
+
+
 def setup_vllm_client(
     settings: Optional[Settings] = None,
     wait_for_server: bool = True
 ) -> VLLMClient:
     """Set up and return a vLLM client.
     
+    The agent sends the same system instructions on every request, so the
+    vLLM server should be started with ``--enable-prefix-caching`` to reuse
+    the KV cache for that shared prefix.
+    
     Args:
         settings: Configuration settings
         wait_for_server: Whether to wait for server to be available
@@ -217,14 +696,78 @@ def setup_vllm_client(
     return client
 
 
+def create_async_openai_client(settings: Optional[Settings] = None) -> "AsyncOpenAI":
+    """Create an async OpenAI client for vLLM with a keep-alive connection pool.
+    
+    Reusing one client across agent runs avoids a new TCP handshake per
+    request.
+    
+    Args:
+        settings: Configuration settings
+        
+    Returns:
+        AsyncOpenAI client configured for vLLM
+    """
+    settings = settings or get_settings()
+    from openai import AsyncOpenAI
+    
+    client = AsyncOpenAI(
+        base_url=settings.vllm.base_url,
+        api_key="dummy",  # Required by OpenAI SDK but not used by vLLM
+        timeout=settings.vllm.timeout,
+        max_retries=settings.vllm.max_retries,
+        http_client=_create_async_http_client(settings),
+    )
+    logger.debug(f"Created pooled async vLLM client for {settings.vllm.base_url}")
+    return client
+
+
+def _create_async_http_client(settings: Settings) -> httpx.AsyncClient:
+    """Create the async HTTP client used by the OpenAI SDK.
+    
+    httpx's async transport scales poorly past a few dozen concurrent
+    requests, so ``vllm.aiohttp_transport`` swaps in the SDK's aiohttp
+    backed client. Falls back to httpx when aiohttp is not installed.
+    
+    Args:
+        settings: Configuration settings
+        
+    Returns:
+        Async HTTP client
+    """
+    if settings.vllm.aiohttp_transport:
+        try:
+            from openai import DefaultAioHttpClient
+            
+            # The SDK's defaults already allow a large connection pool
+            return DefaultAioHttpClient(timeout=settings.vllm.timeout)
+        except (ImportError, RuntimeError) as e:
+            logger.warning(f"aiohttp transport unavailable, using httpx: {e}")
+    
+    return httpx.AsyncClient(
+        timeout=settings.vllm.timeout,
+        limits=ASYNC_POOL_LIMITS,
+    )
+
+
 def get_model_info(settings: Optional[Settings] = None) -> Dict[str, Any]:
     """Get model information from vLLM server.
     
+    One client is kept per server URL and configured model, so repeated
+    calls reuse its connection pool and its ``MODEL_INFO_TTL`` cache instead
+    of building a new client each time. Changing either setting bypasses
+    the cache.
+    
     Args:
         settings: Configuration settings
         
     Returns:
         Model information dictionary
     """
-    client = VLLMClient(settings)
-    return client.get_model_info()
\ No newline at end of file
+    settings = settings or get_settings()
+    key = (settings.vllm.base_url, settings.vllm.model)
+    
+    client = _shared_clients.get(key)
+    if client is None:
+        client = _shared_clients[key] = VLLMClient(settings)
+    return client.get_model_info()
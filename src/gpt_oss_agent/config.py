@@ -4,15 +4,26 @@ This module provides type-safe configuration management using Pydantic,
 supporting environment variables, config files, and programmatic configuration.
 """
 
+import dataclasses
 import os
+import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
-from pydantic import BaseModel, Field, validator
-from pydantic_settings import BaseSettings
+from pydantic import Field, field_validator, model_validator
+from pydantic.dataclasses import dataclass
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
-class VLLMConfig(BaseModel):
+# The nested sections are Pydantic dataclasses: they keep field validation
+# and constraints but avoid BaseModel's per-instance bookkeeping. Dataclass
+# slots need Python 3.10+, so older interpreters get regular instances.
+_config_section = dataclass(slots=sys.version_info >= (3, 10))
+
+
+@_config_section
+class VLLMConfig:
     """Configuration for vLLM client."""
     
     base_url: str = Field(
@@ -37,9 +48,14 @@ class VLLMConfig(BaseModel):
         default=True,
         description="Whether to wait for server to be available on startup"
     )
+    aiohttp_transport: bool = Field(
+        default=False,
+        description="Use aiohttp for async requests (requires openai[aiohttp])"
+    )
 
 
-class ExaConfig(BaseModel):
+@_config_section
+class ExaConfig:
     """Configuration for Exa search API."""
     
     api_key: Optional[str] = Field(
@@ -62,15 +78,14 @@ class ExaConfig(BaseModel):
         description="Default maximum number of search results"
     )
     
-    @validator('enabled')
-    def validate_enabled(cls, v, values):
+    def __post_init__(self):
         """Disable if no API key provided."""
-        if v and not values.get('api_key'):
-            return False
-        return v
+        if self.enabled and not self.api_key:
+            self.enabled = False
 
 
-class LoggingConfig(BaseModel):
+@_config_section
+class LoggingConfig:
     """Configuration for logging."""
     
     level: str = Field(
@@ -86,17 +101,17 @@ class LoggingConfig(BaseModel):
         description="Log file path (optional)"
     )
     
-    @validator('level')
-    def validate_level(cls, v):
+    def __post_init__(self):
         """Validate logging level."""
         valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        v_upper = v.upper()
-        if v_upper not in valid_levels:
-            raise ValueError(f"Invalid log level: {v}. Must be one of {valid_levels}")
-        return v_upper
+        level = self.level.upper()
+        if level not in valid_levels:
+            raise ValueError(f"Invalid log level: {self.level}. Must be one of {valid_levels}")
+        self.level = level
 
 
-class DebugConfig(BaseModel):
+@_config_section
+class DebugConfig:
     """Configuration for debug functionality."""
     
     enabled: bool = Field(
@@ -112,9 +127,14 @@ class DebugConfig(BaseModel):
         ge=1,
         description="Number of debug sessions to keep"
     )
+    verbose: bool = Field(
+        default=False,
+        description="Include full attribute dumps of runner results in debug logs"
+    )
 
 
-class AgentConfig(BaseModel):
+@_config_section
+class AgentConfig:
     """Configuration for the agent."""
     
     name: str = Field(
@@ -133,6 +153,19 @@ class AgentConfig(BaseModel):
         default="run_llm_again",
         description="Tool use behavior for OpenAI Agents SDK"
     )
+    response_cache_size: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum number of cached chat responses (0 disables caching)"
+    )
+
+
+# Legacy flat variables and the nested setting each one maps to
+_LEGACY_ENV_FIELDS = {
+    "VLLM_BASE_URL": ("vllm", "base_url"),
+    "DEFAULT_MODEL": ("vllm", "model"),
+    "EXA_API_KEY": ("exa", "api_key"),
+}
 
 
 class Settings(BaseSettings):
@@ -154,24 +187,36 @@ class Settings(BaseSettings):
     default_model: Optional[str] = Field(default=None, alias="DEFAULT_MODEL")
     exa_api_key: Optional[str] = Field(default=None, alias="EXA_API_KEY")
     
-    class Config:
-        env_file = ".env"
-        env_nested_delimiter = "__"
-        case_sensitive = False
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_nested_delimiter="__",
+        case_sensitive=False,
+    )
+    
+    @model_validator(mode='before')
+    @classmethod
+    def apply_legacy_env(cls, data: Any) -> Any:
+        """Merge legacy flat variables into the nested section inputs.
         
-    def __init__(self, **kwargs):
-        """Initialize settings with legacy environment variable support."""
-        super().__init__(**kwargs)
+        Done before validation so each section is built (and checked, e.g.
+        ``exa.enabled`` against the API key) once, with the legacy values.
+        Legacy values take precedence over nested ones.
+        """
+        if not isinstance(data, dict):
+            return data
         
-        # Handle legacy environment variables
-        if self.vllm_base_url:
-            self.vllm.base_url = self.vllm_base_url
-        if self.default_model:
-            self.vllm.model = self.default_model
-        if self.exa_api_key:
-            self.exa.api_key = self.exa_api_key
-    
-    @validator('debug')
+        for alias, (section, field) in _LEGACY_ENV_FIELDS.items():
+            value = data.get(alias)
+            if not value:
+                continue
+            section_data = data.get(section)
+            if dataclasses.is_dataclass(section_data):
+                section_data = dataclasses.asdict(section_data)
+            data[section] = {**(section_data or {}), field: value}
+        return data
+    
+    @field_validator('debug')
+    @classmethod
     def create_debug_dir(cls, v):
         """Ensure debug directory exists if debug is enabled."""
         if v.enabled:
@@ -181,37 +226,58 @@ class Settings(BaseSettings):
 
 # Global settings instance
 _settings: Optional[Settings] = None
+_settings_lock = threading.Lock()
 
 
 def get_settings() -> Settings:
-    """Get global settings instance."""
+    """Get global settings instance.
+    
+    Construction (which parses the environment and ``.env``) happens once,
+    even when several threads ask for the settings concurrently.
+    """
     global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    settings = _settings
+    if settings is None:
+        with _settings_lock:
+            if _settings is None:
+                _settings = Settings()
+            settings = _settings
+    return settings
 
 
 def reload_settings() -> Settings:
     """Reload settings from environment/files."""
     global _settings
-    _settings = Settings()
-    return _settings
+    with _settings_lock:
+        _settings = Settings()
+        return _settings
 
 
 def configure_from_dict(config_dict: dict) -> Settings:
     """Configure settings from dictionary."""
     global _settings
-    _settings = Settings(**config_dict)
-    return _settings
+    with _settings_lock:
+        _settings = Settings(**config_dict)
+        return _settings
 
 
 # Environment setup for OpenAI SDK compatibility
+def _setenv_if_changed(key: str, value: str) -> None:
+    """Set an environment variable only if its value differs."""
+    if os.environ.get(key) != value:
+        os.environ[key] = value
+
+
 def setup_openai_env(settings: Optional[Settings] = None) -> None:
-    """Set up environment variables for OpenAI SDK compatibility."""
+    """Set up environment variables for OpenAI SDK compatibility.
+    
+    Safe to call repeatedly; variables that already hold the right value
+    are left untouched.
+    """
     if settings is None:
         settings = get_settings()
     
     # Set OpenAI environment variables for SDK compatibility
-    os.environ['OPENAI_BASE_URL'] = settings.vllm.base_url
-    os.environ['OPENAI_API_KEY'] = "dummy"  # Required by SDK but not used
-    os.environ['OPENAI_AGENTS_DISABLE_TRACING'] = "1"  # Disable telemetry
\ No newline at end of file
+    _setenv_if_changed('OPENAI_BASE_URL', settings.vllm.base_url)
+    _setenv_if_changed('OPENAI_API_KEY', "dummy")  # Required by SDK but not used
+    _setenv_if_changed('OPENAI_AGENTS_DISABLE_TRACING', "1")  # Disable telemetry
\ No newline at end of file
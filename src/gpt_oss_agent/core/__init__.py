@@ -1,14 +1,40 @@
 """Core agent functionality."""
 
-from .agent import GPTOSSAgent, create_agent
-from .instructions import get_default_instructions, build_custom_instructions
-from .runner import analyze_runner_result, find_alternative_responses
+import importlib
+from typing import Any, List
+
+# Public names are imported on first access (PEP 562), so using the
+# instruction or runner helpers does not load the agents SDK.
+_LAZY_EXPORTS = {
+    "GPTOSSAgent": ".agent",
+    "create_agent": ".agent",
+    "ResponseCache": ".cache",
+    "get_default_instructions": ".instructions",
+    "build_custom_instructions": ".instructions",
+    "analyze_runner_result": ".runner",
+    "find_alternative_responses": ".runner",
+}
 
 __all__ = [
     "GPTOSSAgent",
     "create_agent", 
+    "ResponseCache",
     "get_default_instructions",
     "build_custom_instructions",
     "analyze_runner_result",
     "find_alternative_responses",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
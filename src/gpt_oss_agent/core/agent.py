@@ -1,18 +1,245 @@
 """Core agent implementation using OpenAI Agents SDK."""
 
+import asyncio
+import dataclasses
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
-from agents import Agent, Runner, set_tracing_disabled
+from agents import Agent, OpenAIProvider, RunConfig, Runner, set_tracing_disabled
 
+from ..clients.vllm import create_async_openai_client
 from ..config import Settings, get_settings
 from ..exceptions import AgentError, EmptyResponseError
+from ..tools.base import get_tool_name
+from ..utils.aio import LoopLocal
+from ..utils.debug_logger import get_debug_logger
+from .cache import ResponseCache
 from .instructions import get_default_instructions
 
 
 logger = logging.getLogger(__name__)
 
 
+# Whether the SDK's process-wide tracing has been switched off
+_tracing_disabled = False
+
+# Alternative attributes that may carry the response when final_output is empty
+_FALLBACK_OUTPUT_ATTRS = ('output', 'outputs', 'response', 'content')
+
+# Reasoning text starting with these is deliberation rather than an answer
+_REJECT_PREFIXES = ("I need to", "Let me", "{")
+
+# Fallback attributes present on each dataclass result type, resolved once
+_fallback_attrs_by_type: Dict[type, Tuple[str, ...]] = {}
+
+
+def _fallback_output_attrs(result: Any) -> Tuple[str, ...]:
+    """Get the fallback output attributes present on a Runner result.
+    
+    Dataclass results (such as the SDK's RunResult) have a fixed attribute
+    set, so the lookup is resolved once per type. Other objects are probed
+    per instance.
+    
+    Args:
+        result: RunResult object from OpenAI Agents SDK
+        
+    Returns:
+        Names of fallback output attributes present on the result
+    """
+    result_type = type(result)
+    attrs = _fallback_attrs_by_type.get(result_type)
+    if attrs is not None:
+        return attrs
+    
+    attrs = tuple(attr for attr in _FALLBACK_OUTPUT_ATTRS if hasattr(result, attr))
+    if dataclasses.is_dataclass(result_type):
+        _fallback_attrs_by_type[result_type] = attrs
+    return attrs
+
+
+def _preview(value: Any, limit: int) -> str:
+    """Build a short repr of a value for logging.
+    
+    Strings are sliced before repr() so long outputs are never copied in full.
+    """
+    if isinstance(value, str):
+        return repr(value[:limit])
+    return repr(value)[:limit]
+
+
+def _attr_names(obj: Any) -> Any:
+    """Get instance attribute names of an object for debug logging."""
+    attrs = getattr(obj, '__dict__', None)
+    return list(attrs) if attrs is not None else 'no_dict'
+
+
+def _from_final_output(result: Any, debug: bool) -> Optional[str]:
+    """Extract the response from the result's final_output."""
+    try:
+        final_output = result.final_output
+    except AttributeError:
+        return None
+    if debug:
+        logger.debug("final_output exists: %s", _preview(final_output, 200))
+    return str(final_output) if final_output else None
+
+
+def _from_output_attrs(result: Any, debug: bool) -> Optional[str]:
+    """Extract the response from alternative output attributes."""
+    for attr in _fallback_output_attrs(result):
+        output = getattr(result, attr)
+        if debug:
+            logger.debug("%s exists: %s - %s", attr, type(output), _preview(output, 200))
+        if output:
+            if isinstance(output, list):
+                output = output[-1]
+            if output:
+                return str(output)
+    return None
+
+
+def _looks_like_answer(text: str) -> bool:
+    """Check whether reasoning text reads like a response, not deliberation."""
+    return len(text) > 50 and not text.startswith(_REJECT_PREFIXES)
+
+
+def _reasoning_text(raw_item: Any, debug: bool) -> Optional[str]:
+    """Extract reasoning content that reads like a final answer."""
+    content = getattr(raw_item, 'content', None)
+    if content is None:
+        return None
+    if debug:
+        logger.debug("Reasoning content items: %s", len(content) if hasattr(content, '__len__') else 'not_list')
+    
+    # Content is either a single string or a list of parts carrying text
+    if isinstance(content, str):
+        texts = (content,)
+    elif hasattr(content, '__iter__'):
+        texts = (getattr(part, 'text', None) for part in content)
+    else:
+        return None
+    
+    text = next(filter(_looks_like_answer, (text.strip() for text in texts if text)), None)
+    if text and debug:
+        logger.debug("Found response in reasoning: %s", _preview(text, 100))
+    return text
+
+
+def _from_new_items(result: Any, debug: bool) -> Optional[str]:
+    """Extract the response from the run's generated items, newest first."""
+    new_items = getattr(result, 'new_items', None)
+    if not new_items:
+        return None
+    if debug:
+        logger.debug("new_items count: %d", len(new_items))
+    
+    for index in range(len(new_items) - 1, -1, -1):
+        item = new_items[index]
+        item_type = getattr(item, 'type', None)
+        if debug:
+            logger.debug("Item %d: type=%s, attrs=%s", index, item_type or 'no_type', _attr_names(item))
+        
+        # Look for message output items
+        if item_type == 'message_output_item':
+            parts = getattr(getattr(item, 'raw_item', None), 'content', None)
+            if parts is not None:
+                if debug:
+                    logger.debug("Content items: %d", len(parts))
+                text = next((part.text for part in parts if getattr(part, 'text', None)), None)
+                if text:
+                    if debug:
+                        logger.debug("Found text content: %s", _preview(text, 100))
+                    return text
+        
+        # Look for assistant message items (alternative format)
+        elif item_type is not None and 'message' in item_type:
+            if debug:
+                logger.debug("Found message item: %s", item_type)
+            content = getattr(item, 'content', None)
+            if content:
+                return str(content)
+        
+        # Look for reasoning items that might contain the actual response
+        elif item_type == 'reasoning_item':
+            raw_item = getattr(item, 'raw_item', None)
+            if debug:
+                logger.debug("Found reasoning_item of type %s", type(raw_item))
+            text = _reasoning_text(raw_item, debug)
+            if text:
+                return text
+        
+        # Fallback: look at any item with content
+        content = getattr(item, 'content', None)
+        if isinstance(content, str) and content.strip():
+            return content
+    return None
+
+
+def _from_raw_responses(result: Any, debug: bool) -> Optional[str]:
+    """Extract the response from the raw model responses."""
+    raw_responses = getattr(result, 'raw_responses', None)
+    if not raw_responses:
+        return None
+    
+    for i, response in enumerate(raw_responses):
+        if debug:
+            logger.debug("Raw response %d: type=%s, attrs: %s", i, type(response), _attr_names(response))
+        
+        choices = getattr(response, 'choices', None)
+        if choices:
+            message = getattr(choices[0], 'message', None)
+            content = getattr(message, 'content', None) if message else None
+            if content:
+                content = content.strip()
+                if debug:
+                    logger.debug("Found content in raw response: %s", _preview(content, 200))
+                if content:
+                    return content
+        
+        # Also check if response itself has content
+        content = getattr(response, 'content', None)
+        if content and content.strip():
+            return content
+    return None
+
+
+# Response extractors in priority order; the first non-empty result wins
+_EXTRACTORS = (_from_final_output, _from_output_attrs, _from_new_items, _from_raw_responses)
+
+
+def _empty_response_debug_info(result: Any) -> Dict[str, Any]:
+    """Describe a Runner result that yielded no response, for error logs."""
+    new_items = getattr(result, 'new_items', None)
+    debug_info = {
+        "result_type": str(type(result)),
+        "has_final_output": hasattr(result, 'final_output'),
+        "final_output_value": getattr(result, 'final_output', None),
+        "has_new_items": new_items is not None,
+        "new_items_count": len(new_items) if new_items is not None else 0,
+        "result_attributes": list(getattr(result, '__dict__', ())),
+        "result_str": str(result)[:500]
+    }
+    
+    if new_items:
+        debug_info["new_items_details"] = [
+            {
+                "index": i,
+                "type": getattr(item, 'type', 'unknown'),
+                "attributes": list(getattr(item, '__dict__', ())),
+                "str_repr": str(item)[:200]
+            }
+            for i, item in enumerate(new_items[:3])  # First 3 items
+        ]
+    
+    return debug_info
+
+
+async def _close_loop_client(loop_client: Tuple[Any, RunConfig]) -> None:
+    """Close the OpenAI client of a per-loop client entry."""
+    await loop_client[0].close()
+
+
 class GPTOSSAgent:
     """Main AI agent powered by local GPT-OSS model via vLLM.
     
@@ -25,6 +252,8 @@ class GPTOSSAgent:
         settings: Optional[Settings] = None,
         tools: Optional[List[Any]] = None,
         instructions: Optional[str] = None,
+        openai_client: Optional[Any] = None,
+        debug: Optional[bool] = None,
     ):
         """Initialize the GPT-OSS agent.
         
@@ -32,50 +261,111 @@ class GPTOSSAgent:
             settings: Configuration settings (uses global if None)
             tools: List of tools to make available to the agent
             instructions: Custom instructions (uses default if None)
+            openai_client: AsyncOpenAI client for vLLM (creates a pooled one if None)
+            debug: Dump interactions to debug log files (uses settings if None)
         """
         self.settings = settings or get_settings()
-        self.tools = tools or []
         
-        # Disable OpenAI tracing completely for local operation
-        set_tracing_disabled(True)
+        if debug is None:
+            debug = self.settings.debug.enabled
+        self._debug_logger = get_debug_logger(enabled=True) if debug else None
+        # Tools keyed by name for O(1) membership checks and removal
+        self._tools: Dict[str, Any] = {}
+        for tool in tools or []:
+            self._tools.setdefault(get_tool_name(tool), tool)
+        self._tool_names: Tuple[str, ...] = tuple(self._tools)
+        
+        # Responses are cached per configuration generation; bumping the
+        # generation invalidates every entry without scanning the cache.
+        self._cache = ResponseCache(self.settings.agent.response_cache_size)
+        self._generation = 0
+        
+        # A pooled client keeps connections alive between requests; the
+        # sync wrappers run on a persistent event loop so those connections
+        # stay usable across calls. Connections belong to the loop that
+        # opened them, so the agent keeps one client per event loop, closed
+        # when that loop shuts down. A client passed in by the caller is
+        # used as is and left for the caller to close.
+        self._openai_client = openai_client
+        self._run_config = RunConfig(
+            model_provider=OpenAIProvider(openai_client=openai_client)
+        ) if openai_client is not None else None
+        self._loop_clients: LoopLocal[Tuple[Any, RunConfig]] = LoopLocal(
+            self._create_loop_client, _close_loop_client
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # The private loop can only run one coroutine at a time
+        self._loop_lock = threading.Lock()
+        
+        # Disable OpenAI tracing completely for local operation. This is a
+        # process-wide SDK switch, so it only needs flipping once.
+        global _tracing_disabled
+        if not _tracing_disabled:
+            set_tracing_disabled(True)
+            _tracing_disabled = True
         
         # Get instructions
         if instructions is None:
             instructions = self._get_default_instructions()
+        self._instructions_len = len(instructions)
         
         # Create the agent
         self.agent = Agent(
             name=self.settings.agent.name,
             instructions=instructions,
-            tools=self.tools,
+            tools=list(self._tools.values()),
             model=self.settings.vllm.model
         )
         
-        logger.info(f"Agent initialized with model: {self.settings.vllm.model}")
-        logger.info(f"Available tools: {self._get_tool_names()}")
+        logger.info("Agent initialized with model: %s", self.settings.vllm.model)
+        logger.info("Available tools: %s", self._tool_names)
     
     def _get_default_instructions(self) -> str:
         """Get default instructions for the agent."""
-        has_web_search = any(
-            hasattr(tool, '__name__') and tool.__name__ in ['web_search', 'get_page_content']
-            for tool in self.tools
-        )
+        # Function tools expose ``name`` rather than ``__name__``, so look
+        # them up in the name-keyed tool dict instead of probing objects.
+        has_web_search = 'web_search' in self._tools or 'get_page_content' in self._tools
         return get_default_instructions(has_web_search=has_web_search)
     
+    @property
+    def tools(self) -> Tuple[Any, ...]:
+        """Tools available to the agent.
+        
+        Returned as a tuple so callers cannot mutate it in place; use
+        :meth:`add_tool` and :meth:`remove_tool` instead.
+        """
+        return tuple(self._tools.values())
+    
     def _get_tool_names(self) -> List[str]:
         """Get list of tool names."""
-        names = []
-        for tool in self.tools:
-            name = getattr(tool, 'name', getattr(tool, '__name__', str(tool)))
-            names.append(name)
-        return names
+        return list(self._tool_names)
     
     def chat(self, message: str, **kwargs) -> str:
         """Send a synchronous message to the agent.
         
+        This is a blocking wrapper around :meth:`achat`. Callers that already
+        run an event loop (e.g. a server handler) should await :meth:`achat`
+        directly so concurrent requests can be batched by vLLM.
+        
+        Args:
+            message: User message
+            **kwargs: Additional arguments for Runner.run
+            
+        Returns:
+            Agent response as string
+            
+        Raises:
+            AgentError: If the agent encounters an error
+            EmptyResponseError: If the agent returns no output
+        """
+        return self._run_sync(self.achat(message, **kwargs))
+    
+    async def achat(self, message: str, **kwargs) -> str:
+        """Send a message to the agent asynchronously.
+        
         Args:
             message: User message
-            **kwargs: Additional arguments for Runner.run_sync
+            **kwargs: Additional arguments for Runner.run
             
         Returns:
             Agent response as string
@@ -84,58 +374,234 @@ class GPTOSSAgent:
             AgentError: If the agent encounters an error
             EmptyResponseError: If the agent returns no output
         """
+        # Only plain messages are cacheable; extra runner arguments may
+        # change the outcome in ways the key does not capture.
+        cache_key = self._cache_key(message) if not kwargs else None
+        if cache_key is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                logger.info("Returning cached response")
+                return cached
+        
+        if "run_config" not in kwargs:
+            _, kwargs["run_config"] = await self._get_loop_client()
+        
+        debug_logger = self._debug_logger
+        if debug_logger is not None:
+            debug_logger.log_user_input(message)
+        
+        # Checked inline rather than cached at import time so that level
+        # changes made after the module is loaded are still honoured.
+        log_info = logger.isEnabledFor(logging.INFO)
+        
         try:
-            logger.info(f"Starting chat with message: {message[:50]}...")
+            if log_info:
+                logger.info("Starting chat with message: %s...", message[:50])
             
             # Run the agent
-            result = Runner.run_sync(
+            result = await Runner.run(
                 self.agent,
                 message,
                 **kwargs
             )
             
-            logger.info(f"Runner completed. Result type: {type(result)}")
-            
-            # Extract response
-            response = self._extract_response(result)
+            if log_info:
+                logger.info("Runner completed. Result type: %s", type(result))
+            if debug_logger is not None:
+                debug_logger.log_runner_result(result)
             
-            if not response:
-                # Create detailed debug information
-                debug_info = {
-                    "result_type": str(type(result)),
-                    "has_final_output": hasattr(result, 'final_output'),
-                    "final_output_value": getattr(result, 'final_output', None),
-                    "has_new_items": hasattr(result, 'new_items'),
-                    "new_items_count": len(result.new_items) if hasattr(result, 'new_items') else 0,
-                    "result_attributes": list(result.__dict__.keys()) if hasattr(result, '__dict__') else [],
-                    "result_str": str(result)[:500]
-                }
-                
-                if hasattr(result, 'new_items') and result.new_items:
-                    debug_info["new_items_details"] = []
-                    for i, item in enumerate(result.new_items[:3]):  # First 3 items
-                        item_debug = {
-                            "index": i,
-                            "type": getattr(item, 'type', 'unknown'),
-                            "attributes": list(item.__dict__.keys()) if hasattr(item, '__dict__') else [],
-                            "str_repr": str(item)[:200]
-                        }
-                        debug_info["new_items_details"].append(item_debug)
-                
-                logger.error(f"Empty response debug info: {debug_info}")
-                
-                raise EmptyResponseError(
-                    details=f"Result had {debug_info['new_items_count']} new_items. Debug info logged."
+            response = self._process_result(result)
+            if debug_logger is not None:
+                debug_logger.log_agent_response(
+                    response,
+                    metadata_factory=lambda: {
+                        "result_type": str(type(result)),
+                        "new_items_count": len(getattr(result, 'new_items', None) or ()),
+                    }
                 )
-            
+            if cache_key is not None:
+                self._cache.put(cache_key, response)
             return response
             
         except Exception as e:
+            if debug_logger is not None:
+                debug_logger.log_error(e, context="chat")
             if isinstance(e, (AgentError, EmptyResponseError)):
                 raise
             logger.error(f"Error in chat: {e}", exc_info=True)
             raise AgentError(f"Chat failed: {str(e)}")
     
+    def chat_many(self, messages: List[str], **kwargs) -> List[str]:
+        """Send several messages concurrently and wait for all responses.
+        
+        Blocking wrapper around :meth:`achat_many`.
+        
+        Args:
+            messages: User messages
+            **kwargs: Additional arguments for achat_many
+            
+        Returns:
+            Agent responses in the same order as ``messages``
+        """
+        return self._run_sync(self.achat_many(messages, **kwargs))
+    
+    async def achat_many(
+        self,
+        messages: List[str],
+        max_concurrency: Optional[int] = None,
+        **kwargs
+    ) -> List[str]:
+        """Send several messages concurrently.
+        
+        All requests are in flight at once so vLLM's continuous batcher can
+        schedule them together instead of one after another.
+        
+        Args:
+            messages: User messages
+            max_concurrency: Maximum number of in-flight requests (unbounded if None)
+            **kwargs: Additional arguments for Runner.run
+            
+        Returns:
+            Agent responses in the same order as ``messages``
+            
+        Raises:
+            AgentError: If any request fails
+            EmptyResponseError: If any request returns no output
+        """
+        if not max_concurrency:
+            return list(await asyncio.gather(
+                *(self.achat(message, **kwargs) for message in messages)
+            ))
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run_one(message: str) -> str:
+            async with semaphore:
+                return await self.achat(message, **kwargs)
+        
+        return list(await asyncio.gather(*(run_one(message) for message in messages)))
+    
+    def warmup(self, connections: int = 1) -> None:
+        """Open pooled connections to the vLLM server ahead of the first chat.
+        
+        Blocking wrapper around :meth:`awarmup`.
+        
+        Args:
+            connections: Number of connections to open
+        """
+        self._run_sync(self.awarmup(connections))
+    
+    async def awarmup(self, connections: int = 1) -> None:
+        """Open pooled connections to the vLLM server ahead of the first chat.
+        
+        Issues ``connections`` concurrent ``/models`` requests so that many
+        sockets are already idle in the client's keep-alive pool when real
+        requests start, e.g. right before a :meth:`chat_many` burst. Idle
+        connections are dropped after the server's keep-alive timeout (5s by
+        default for vLLM), so warm up shortly before use.
+        
+        Args:
+            connections: Number of connections to open
+        """
+        client, _ = await self._get_loop_client()
+        try:
+            await asyncio.gather(
+                *(client.models.list() for _ in range(connections))
+            )
+        except Exception as e:
+            # Warmup is best effort; the real request reports any failure
+            logger.debug("Connection warmup failed: %s", e)
+    
+    def _create_loop_client(self) -> Tuple[Any, RunConfig]:
+        """Create a pooled client and matching run configuration for one loop."""
+        client = create_async_openai_client(self.settings)
+        return client, RunConfig(model_provider=OpenAIProvider(openai_client=client))
+    
+    async def _get_loop_client(self) -> Tuple[Any, RunConfig]:
+        """Get the OpenAI client and run configuration for the running loop."""
+        if self._run_config is not None:
+            return self._openai_client, self._run_config
+        return await self._loop_clients.get()
+    
+    def _run_sync(self, coro: Any) -> Any:
+        """Run a coroutine to completion on the agent's event loop.
+        
+        Calls from several threads are serialized, since the loop can only
+        run one of them at a time.
+        """
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+            return self._loop.run_until_complete(coro)
+    
+    def close(self) -> None:
+        """Close the agent's pooled HTTP clients and its event loop.
+        
+        The private loop's client is closed right away. Clients of other
+        loops that are still open are closed on those loops; clients of
+        loops that already shut down (e.g. after ``asyncio.run``) were
+        closed at that point.
+        """
+        with self._loop_lock:
+            if self._loop is not None and not self._loop.is_closed():
+                # Finalizes the cleanup generator of the loop's client
+                self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+                self._loop.close()
+            self._loop = None
+        self._loop_clients.close_all()
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client of the running loop."""
+        await self._loop_clients.aclose()
+    
+    def _cache_key(self, message: str) -> Optional[Tuple[Any, ...]]:
+        """Build the response cache key for a message.
+        
+        Args:
+            message: User message
+            
+        Returns:
+            Cache key tuple, or None if caching is disabled
+        """
+        if not self._cache.enabled:
+            return None
+        return (
+            self.settings.vllm.model,
+            hash(self.agent.instructions),
+            self._generation,
+            " ".join(message.split()),
+        )
+    
+    def _invalidate_cache(self) -> None:
+        """Invalidate cached responses after a configuration change."""
+        self._generation += 1
+        self._cache.clear()
+    
+    def _process_result(self, result: Any) -> str:
+        """Extract the response from a Runner result or raise if empty.
+        
+        Args:
+            result: RunResult object from OpenAI Agents SDK
+            
+        Returns:
+            Agent response as string
+            
+        Raises:
+            EmptyResponseError: If no response could be extracted
+        """
+        response = self._extract_response(result)
+        
+        if not response:
+            new_items = getattr(result, 'new_items', None) or []
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("Empty response debug info: %s", _empty_response_debug_info(result))
+            
+            raise EmptyResponseError(
+                details=f"Result had {len(new_items)} new_items. Debug info logged."
+            )
+        
+        return response
+    
     def _extract_response(self, result: Any) -> str:
         """Extract response from Runner result with detailed debugging.
         
@@ -145,127 +611,29 @@ class GPTOSSAgent:
         Returns:
             Response string or empty string if none found
         """
-        logger.debug(f"Extracting response from result type: {type(result)}")
-        
-        # Detailed debugging of the result object
-        if hasattr(result, '__dict__'):
-            logger.debug(f"Result attributes: {list(result.__dict__.keys())}")
-        
-        # Check if there are any raw_responses early
-        if hasattr(result, 'raw_responses') and result.raw_responses:
-            logger.debug(f"Result has {len(result.raw_responses)} raw responses")
-        
-        # Try final_output first
-        if hasattr(result, 'final_output'):
-            logger.debug(f"final_output exists: {result.final_output}")
-            if result.final_output:
-                return str(result.final_output)
-        
-        # Try alternative output attributes
-        for attr in ['output', 'outputs', 'response', 'content']:
-            if hasattr(result, attr):
-                output = getattr(result, attr)
-                logger.debug(f"{attr} exists: {type(output)} - {repr(output)[:200]}")
-                if output:
-                    if isinstance(output, list) and output:
-                        output = output[-1]
-                    if output:
-                        return str(output)
-        
-        # Try extracting from new_items with detailed logging
-        if hasattr(result, 'new_items') and result.new_items:
-            logger.debug(f"new_items count: {len(result.new_items)}")
+        # Debug arguments (attribute dumps, reprs, lengths) are evaluated
+        # before logger.debug is even called, so every debug call is gated
+        # on one level check to keep the hot path free of them.
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Extracting response from result type: %s", type(result))
             
-            # Look for message output in reverse order (most recent first)
-            for i, item in enumerate(reversed(result.new_items)):
-                actual_index = len(result.new_items) - 1 - i
-                logger.debug(f"Item {actual_index}: type={getattr(item, 'type', 'no_type')}, attrs={list(item.__dict__.keys()) if hasattr(item, '__dict__') else 'no_dict'}")
-                
-                # Look for message output items
-                if hasattr(item, 'type') and item.type == 'message_output_item':
-                    logger.debug(f"Found message_output_item at index {actual_index}")
-                    if hasattr(item, 'raw_item') and hasattr(item.raw_item, 'content'):
-                        logger.debug(f"Content items: {len(item.raw_item.content)}")
-                        for j, content in enumerate(item.raw_item.content):
-                            logger.debug(f"Content {j}: type={type(content)}, has_text={hasattr(content, 'text')}")
-                            if hasattr(content, 'text') and content.text:
-                                logger.debug(f"Found text content: {repr(content.text)[:100]}")
-                                return content.text
-                
-                # Look for assistant message items (alternative format)
-                elif hasattr(item, 'type') and 'message' in item.type:
-                    logger.debug(f"Found message item: {item.type}")
-                    if hasattr(item, 'content'):
-                        logger.debug(f"Direct content: {repr(item.content)[:100]}")
-                        if item.content:
-                            return str(item.content)
-                
-                # Look for reasoning items that might contain the actual response
-                elif hasattr(item, 'type') and item.type == 'reasoning_item':
-                    logger.debug(f"Found reasoning_item at index {actual_index}")
-                    if hasattr(item, 'raw_item'):
-                        raw_item = item.raw_item
-                        logger.debug(f"Raw item type: {type(raw_item)}")
-                        
-                        # Check if raw_item has content
-                        if hasattr(raw_item, 'content'):
-                            logger.debug(f"Reasoning content items: {len(raw_item.content) if hasattr(raw_item.content, '__len__') else 'not_list'}")
-                            
-                            # Handle content as list
-                            if hasattr(raw_item.content, '__iter__') and not isinstance(raw_item.content, str):
-                                for j, content in enumerate(raw_item.content):
-                                    logger.debug(f"Reasoning content {j}: type={type(content)}")
-                                    if hasattr(content, 'text') and content.text and content.text.strip():
-                                        # Only return reasoning if it looks like a response, not just reasoning
-                                        text = content.text.strip()
-                                        logger.debug(f"Reasoning text content: {repr(text)[:200]}")
-                                        if not text.startswith("I need to") and not text.startswith("Let me") and len(text) > 50 and not text.startswith("{"):
-                                            logger.debug(f"Found response in reasoning: {repr(text)[:100]}")
-                                            return text
-                            
-                            # Handle content as string
-                            elif isinstance(raw_item.content, str) and raw_item.content.strip():
-                                text = raw_item.content.strip()
-                                logger.debug(f"Reasoning string content: {repr(text)[:200]}")
-                                if not text.startswith("I need to") and not text.startswith("Let me") and len(text) > 50 and not text.startswith("{"):
-                                    logger.debug(f"Found response in reasoning content: {repr(text)[:100]}")
-                                    return text
-                
-                # Fallback: look at any item with content
-                if hasattr(item, 'content') and item.content:
-                    logger.debug(f"Item {actual_index} has direct content: {repr(item.content)[:100]}")
-                    if isinstance(item.content, str) and item.content.strip():
-                        return item.content
-        
-        # Final fallback: try to extract from raw_responses
-        if hasattr(result, 'raw_responses') and result.raw_responses:
-            logger.debug(f"Checking raw_responses: {len(result.raw_responses)}")
-            for i, response in enumerate(result.raw_responses):
-                logger.debug(f"Raw response {i}: type={type(response)}")
-                logger.debug(f"Raw response attributes: {list(response.__dict__.keys()) if hasattr(response, '__dict__') else 'no_dict'}")
-                
-                if hasattr(response, 'choices') and response.choices:
-                    logger.debug(f"Response has {len(response.choices)} choices")
-                    choice = response.choices[0]
-                    logger.debug(f"Choice type: {type(choice)}, attrs: {list(choice.__dict__.keys()) if hasattr(choice, '__dict__') else 'no_dict'}")
-                    
-                    if hasattr(choice, 'message') and choice.message:
-                        logger.debug(f"Message type: {type(choice.message)}, attrs: {list(choice.message.__dict__.keys()) if hasattr(choice.message, '__dict__') else 'no_dict'}")
-                        if hasattr(choice.message, 'content') and choice.message.content:
-                            content = choice.message.content.strip()
-                            logger.debug(f"Found content in raw response: {repr(content)[:200]}")
-                            if content:
-                                return content
-                
-                # Also check if response itself has content
-                if hasattr(response, 'content') and response.content:
-                    logger.debug(f"Response has direct content: {repr(response.content)[:200]}")
-                    if response.content.strip():
-                        return response.content
-        
-        # Final fallback: try to extract any text from the result
-        result_str = str(result)
-        logger.debug(f"Result string representation: {repr(result_str)[:200]}")
+            # Detailed debugging of the result object
+            logger.debug("Result attributes: %s", _attr_names(result))
+            
+            # Check if there are any raw_responses early
+            raw_responses = getattr(result, 'raw_responses', None)
+            if raw_responses:
+                logger.debug("Result has %d raw responses", len(raw_responses))
+        
+        for extractor in _EXTRACTORS:
+            response = extractor(result, debug)
+            if response:
+                return response
+        
+        # Final fallback: log the result representation for diagnosis
+        if debug:
+            logger.debug("Result string representation: %s", _preview(str(result), 200))
         
         return ""
     
@@ -277,7 +645,7 @@ class GPTOSSAgent:
             "model": self.settings.vllm.model,
             "vllm_base_url": self.settings.vllm.base_url,
             "available_tools": self._get_tool_names(),
-            "instructions_length": len(self.agent.instructions),
+            "instructions_length": self._instructions_len,
             "settings": {
                 "debug_enabled": self.settings.debug.enabled,
                 "web_search_enabled": bool(self.settings.exa.api_key and self.settings.exa.enabled),
@@ -291,22 +659,31 @@ class GPTOSSAgent:
             new_instructions: New instruction string
         """
         self.agent.instructions = new_instructions
+        self._instructions_len = len(new_instructions)
+        self._invalidate_cache()
         logger.info("Agent instructions updated")
     
+    def _on_tools_changed(self) -> None:
+        """Propagate a tool set change to the SDK agent and cached state."""
+        self._tool_names = tuple(self._tools)
+        # The SDK requires a list, so each agent gets its own copy
+        self.agent.tools = list(self._tools.values())
+        self._invalidate_cache()
+    
     def add_tool(self, tool_func: Any) -> None:
         """Add a new tool to the agent.
         
         Args:
             tool_func: Tool function to add
         """
-        if tool_func not in self.tools:
-            self.tools.append(tool_func)
-            self.agent.tools = self.tools
-            tool_name = getattr(tool_func, 'name', getattr(tool_func, '__name__', str(tool_func)))
-            logger.info(f"Added tool: {tool_name}")
-        else:
-            tool_name = getattr(tool_func, 'name', getattr(tool_func, '__name__', str(tool_func)))
+        tool_name = get_tool_name(tool_func)
+        if tool_name in self._tools:
             logger.warning(f"Tool {tool_name} already exists")
+            return
+        
+        self._tools[tool_name] = tool_func
+        self._on_tools_changed()
+        logger.info("Added tool: %s", tool_name)
     
     def remove_tool(self, tool_func: Any) -> None:
         """Remove a tool from the agent.
@@ -314,20 +691,21 @@ class GPTOSSAgent:
         Args:
             tool_func: Tool function to remove
         """
-        if tool_func in self.tools:
-            self.tools.remove(tool_func)
-            self.agent.tools = self.tools
-            tool_name = getattr(tool_func, 'name', getattr(tool_func, '__name__', str(tool_func)))
-            logger.info(f"Removed tool: {tool_name}")
-        else:
-            tool_name = getattr(tool_func, 'name', getattr(tool_func, '__name__', str(tool_func)))
+        tool_name = get_tool_name(tool_func)
+        if self._tools.pop(tool_name, None) is None:
             logger.warning(f"Tool {tool_name} not found")
+            return
+        
+        self._on_tools_changed()
+        logger.info("Removed tool: %s", tool_name)
 
 
 def create_agent(
     settings: Optional[Settings] = None,
     tools: Optional[List[Any]] = None,
-    instructions: Optional[str] = None
+    instructions: Optional[str] = None,
+    openai_client: Optional[Any] = None,
+    debug: Optional[bool] = None
 ) -> GPTOSSAgent:
     """Factory function to create a GPT-OSS agent.
     
@@ -335,6 +713,8 @@ def create_agent(
         settings: Configuration settings
         tools: List of tools to enable
         instructions: Custom instructions
+        openai_client: AsyncOpenAI client for vLLM (optional)
+        debug: Dump interactions to debug log files (optional)
         
     Returns:
         GPTOSSAgent instance
@@ -342,5 +722,7 @@ def create_agent(
     return GPTOSSAgent(
         settings=settings,
         tools=tools,
-        instructions=instructions
+        instructions=instructions,
+        openai_client=openai_client,
+        debug=debug
     )
\ No newline at end of file
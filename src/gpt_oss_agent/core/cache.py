@@ -0,0 +1,81 @@
+"""Response caching for agent chat calls."""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """Thread-safe LRU cache for agent responses.
+    
+    Entries are keyed by a caller-supplied hashable key, typically a
+    ``(model, instructions_hash, generation, message)`` tuple, so that
+    any change to the agent configuration naturally misses the cache.
+    """
+    
+    def __init__(self, max_size: int = 128):
+        """Initialize the response cache.
+        
+        Args:
+            max_size: Maximum number of entries to keep (0 disables caching)
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores entries."""
+        return self.max_size > 0
+    
+    def get(self, key: Hashable) -> Optional[str]:
+        """Look up a cached response.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached response or None on a miss
+        """
+        if not self.enabled:
+            return None
+        
+        with self._lock:
+            response = self._entries.get(key)
+            if response is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return response
+    
+    def put(self, key: Hashable, response: str) -> None:
+        """Store a response, evicting the least recently used entry if full.
+        
+        Args:
+            key: Cache key
+            response: Response to cache
+        """
+        if not self.enabled:
+            return
+        
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+        logger.debug("Response cache cleared")
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -3,16 +3,7 @@
 from typing import List
 
 
-def get_default_instructions(has_web_search: bool = False) -> str:
-    """Get default instructions for the agent.
-    
-    Args:
-        has_web_search: Whether web search tools are available
-        
-    Returns:
-        Default instruction string
-    """
-    base_instructions = """You are a helpful and knowledgeable AI assistant powered by the GPT-OSS model running locally.
+_BASE_INSTRUCTIONS = """You are a helpful and knowledgeable AI assistant powered by the GPT-OSS model running locally.
 
 You should:
 - Be concise but thorough in your responses
@@ -21,8 +12,7 @@ You should:
 - Ask clarifying questions when the user's request is ambiguous
 - Be honest about the limitations of your knowledge"""
 
-    if has_web_search:
-        web_search_instructions = """
+_WEB_SEARCH_INSTRUCTIONS = """
 
 You have access to web search capabilities through the following tools ONLY:
 - web_search: Search the internet for current information
@@ -40,21 +30,38 @@ IMPORTANT: Only use the two tools listed above. If you need to find information
 
 Always be clear about when you're using web search vs. your training knowledge."""
 
-        base_instructions += web_search_instructions
-
-    footer = """
+_FOOTER = """
 
 Remember that you're running on a local model, so you have the benefit of privacy and control, but you should use web search to supplement your knowledge when needed for current events or specific factual queries."""
 
-    return base_instructions + footer
+# Built once at import time so every request sends a byte-identical prefix,
+# which lets vLLM's automatic prefix caching reuse the instruction KV cache.
+_DEFAULT_INSTRUCTIONS_WITH_TOOLS = _BASE_INSTRUCTIONS + _WEB_SEARCH_INSTRUCTIONS + _FOOTER
+_DEFAULT_INSTRUCTIONS_NO_TOOLS = _BASE_INSTRUCTIONS + _FOOTER
+
+_TOOL_DESCRIPTIONS = {
+    "web_search": "Search the internet for current information",
+    "get_page_content": "Retrieve the full content of specific web pages",
+}
+
+
+def get_default_instructions(has_web_search: bool = False) -> str:
+    """Get default instructions for the agent.
+    
+    Args:
+        has_web_search: Whether web search tools are available
+        
+    Returns:
+        Default instruction string
+    """
+    if has_web_search:
+        return _DEFAULT_INSTRUCTIONS_WITH_TOOLS
+    return _DEFAULT_INSTRUCTIONS_NO_TOOLS
 
 
 def get_tool_descriptions() -> dict:
     """Get descriptions of available tools for instruction generation."""
-    return {
-        "web_search": "Search the internet for current information",
-        "get_page_content": "Retrieve the full content of specific web pages",
-    }
+    return dict(_TOOL_DESCRIPTIONS)
 
 
 def build_custom_instructions(
@@ -72,17 +79,17 @@ def build_custom_instructions(
     Returns:
         Custom instruction string
     """
-    instructions = base_behavior
+    parts = [base_behavior]
     
     if available_tools:
-        tool_descriptions = get_tool_descriptions()
-        tools_section = "\n\nAvailable tools:\n"
-        for tool in available_tools:
-            if tool in tool_descriptions:
-                tools_section += f"- {tool}: {tool_descriptions[tool]}\n"
-        instructions += tools_section
+        parts.append("\n\nAvailable tools:\n")
+        parts.extend(
+            f"- {tool}: {_TOOL_DESCRIPTIONS[tool]}\n"
+            for tool in available_tools
+            if tool in _TOOL_DESCRIPTIONS
+        )
     
     if additional_context:
-        instructions += f"\n\nAdditional context:\n{additional_context}"
+        parts.append(f"\n\nAdditional context:\n{additional_context}")
     
-    return instructions
\ No newline at end of file
+    return "".join(parts)
\ No newline at end of file
@@ -10,6 +10,25 @@ from agents import function_tool
 logger = logging.getLogger(__name__)
 
 
+def get_tool_name(tool: Any, default: Optional[str] = None) -> str:
+    """Get the display name of a tool.
+    
+    Function tools expose ``name``, plain functions ``__name__``. The
+    fallback is only computed when neither exists.
+    
+    Args:
+        tool: Tool function or instance
+        default: Name to use when the tool has no name (``str(tool)`` if None)
+        
+    Returns:
+        Tool name
+    """
+    name = getattr(tool, 'name', None) or getattr(tool, '__name__', None)
+    if name:
+        return name
+    return default if default is not None else str(tool)
+
+
 class ToolProtocol(Protocol):
     """Protocol for tools used by the agent."""
     
@@ -4,7 +4,7 @@ import logging
 from typing import Any, Dict, List, Optional, Type
 
 from ..config import Settings, get_settings
-from .base import BaseTool
+from .base import BaseTool, get_tool_name
 from .web_search import get_available_tools as get_web_search_tools, check_tools_status
 
 
@@ -27,6 +27,7 @@ class ToolRegistry:
         self.settings = settings or get_settings()
         self._tools: Dict[str, Any] = {}
         self._tool_status: Dict[str, Dict[str, Any]] = {}
+        self._summary: Optional[Dict[str, Any]] = None
         
         # Auto-discover tools
         self._discover_tools()
@@ -38,7 +39,7 @@ class ToolRegistry:
         # Web search tools
         web_tools = get_web_search_tools()
         for tool in web_tools:
-            tool_name = getattr(tool, 'name', getattr(tool, '__name__', str(tool)))
+            tool_name = get_tool_name(tool)
             self._tools[tool_name] = tool
             logger.debug(f"Registered tool: {tool_name}")
         
@@ -52,6 +53,7 @@ class ToolRegistry:
         """Update tool availability status."""
         # Web search tools status
         web_status = check_tools_status()
+        self._summary = None
         
         for tool_name, tool in self._tools.items():
             status = {
@@ -144,7 +146,7 @@ class ToolRegistry:
             tool: Tool function or instance
             name: Tool name (uses tool name attribute if None)
         """
-        tool_name = name or getattr(tool, 'name', getattr(tool, '__name__', 'unknown'))
+        tool_name = name or get_tool_name(tool, default='unknown')
         
         self._tools[tool_name] = tool
         
@@ -156,6 +158,7 @@ class ToolRegistry:
             "type": "custom",
             "category": "custom",
         }
+        self._summary = None
         
         logger.info(f"Registered custom tool: {tool_name}")
     
@@ -171,6 +174,7 @@ class ToolRegistry:
         if name in self._tools:
             del self._tools[name]
             del self._tool_status[name]
+            self._summary = None
             logger.info(f"Unregistered tool: {name}")
             return True
         
@@ -179,6 +183,7 @@ class ToolRegistry:
     def refresh(self) -> None:
         """Refresh tool discovery and status."""
         logger.info("Refreshing tool registry...")
+        check_tools_status.cache_clear()
         self._tools.clear()
         self._tool_status.clear()
         self._discover_tools()
@@ -186,9 +191,19 @@ class ToolRegistry:
     def get_summary(self) -> Dict[str, Any]:
         """Get registry summary.
         
+        The summary is computed once and reused until the registered tools
+        change, so repeated status commands do not re-walk the registry.
+        Treat the returned dictionary as read-only.
+        
         Returns:
             Summary of registry state
         """
+        if self._summary is None:
+            self._summary = self._build_summary()
+        return self._summary
+    
+    def _build_summary(self) -> Dict[str, Any]:
+        """Build the registry summary from the current tool status."""
         total_tools = len(self._tools)
         available_tools = len([t for t, s in self._tool_status.items() if s.get('available', False)])
         
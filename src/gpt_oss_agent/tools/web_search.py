@@ -1,5 +1,6 @@
 """Web search tools using Exa API."""
 
+import functools
 import logging
 from typing import Any, Dict, Optional
 
@@ -8,6 +9,7 @@ from agents import function_tool
 from ..clients.exa import ExaSearchClient
 from ..config import get_settings
 from ..exceptions import WebSearchError
+from ..utils.debug_logger import get_debug_logger
 from .base import log_tool_execution
 
 
@@ -35,6 +37,33 @@ class WebSearchTool:
         """Check if web search is available."""
         return self.client.is_available()
     
+    def _check_request(self, query: str) -> Optional[str]:
+        """Return an error message if a search cannot be performed."""
+        if not self.is_available():
+            return "Error: Web search not available - Exa API key not configured"
+        
+        if not query or not query.strip():
+            return "Error: Search query cannot be empty"
+        
+        return None
+    
+    def _error_message(self, error: Exception) -> str:
+        """Format a search failure for the model."""
+        if isinstance(error, WebSearchError):
+            error_msg = f"Web search error: {error.message}"
+            if error.details:
+                error_msg += f" ({error.details})"
+            return error_msg
+        
+        logger.error(f"Unexpected error in web search: {error}", exc_info=True)
+        return f"Error: Unexpected web search error: {str(error)}"
+    
+    def _format_results(self, results: Dict[str, Any], query: str) -> str:
+        """Format search results and log their size."""
+        formatted_results = self.client.format_search_results(results, query)
+        logger.info("Search completed, result length: %d", len(formatted_results))
+        return formatted_results
+    
     def execute(self, query: str, num_results: int = 5) -> str:
         """Execute web search.
         
@@ -45,36 +74,45 @@ class WebSearchTool:
         Returns:
             Formatted search results or error message
         """
-        if not self.is_available():
-            return "Error: Web search not available - Exa API key not configured"
-        
-        if not query or not query.strip():
-            return "Error: Search query cannot be empty"
+        error = self._check_request(query)
+        if error:
+            return error
         
         # Validate num_results
         if num_results < 1 or num_results > 10:
             num_results = 5
         
         try:
-            logger.info(f"Performing web search for: {query}")
-            
-            # Perform search
+            logger.info("Performing web search for: %s", query)
             results = self.client.search(query, num_results=num_results)
+            return self._format_results(results, query)
+        except Exception as e:
+            return self._error_message(e)
+    
+    async def aexecute(self, query: str, num_results: int = 5) -> str:
+        """Execute web search without blocking the event loop.
+        
+        Args:
+            query: Search query string
+            num_results: Number of results to return (1-10)
             
-            # Format results
-            formatted_results = self.client.format_search_results(results, query)
-            
-            logger.info(f"Search completed, result length: {len(formatted_results)}")
-            return formatted_results
-            
-        except WebSearchError as e:
-            error_msg = f"Web search error: {e.message}"
-            if e.details:
-                error_msg += f" ({e.details})"
-            return error_msg
+        Returns:
+            Formatted search results or error message
+        """
+        error = self._check_request(query)
+        if error:
+            return error
+        
+        # Validate num_results
+        if num_results < 1 or num_results > 10:
+            num_results = 5
+        
+        try:
+            logger.info("Performing web search for: %s", query)
+            results = await self.client.asearch(query, num_results=num_results)
+            return self._format_results(results, query)
         except Exception as e:
-            logger.error(f"Unexpected error in web search: {e}", exc_info=True)
-            return f"Error: Unexpected web search error: {str(e)}"
+            return self._error_message(e)
 
 
 class PageContentTool:
@@ -94,6 +132,33 @@ class PageContentTool:
         """Check if page content retrieval is available."""
         return self.client.is_available()
     
+    def _check_request(self, url: str) -> Optional[str]:
+        """Return an error message if the page cannot be retrieved."""
+        if not self.is_available():
+            return "Error: Page content retrieval not available - Exa API key not configured"
+        
+        if not url:
+            return "Error: URL cannot be empty"
+        
+        return None
+    
+    def _error_message(self, error: Exception) -> str:
+        """Format a retrieval failure for the model."""
+        if isinstance(error, WebSearchError):
+            error_msg = f"Page content error: {error.message}"
+            if error.details:
+                error_msg += f" ({error.details})"
+            return error_msg
+        
+        logger.error(f"Unexpected error in page content retrieval: {error}", exc_info=True)
+        return f"Error: Unexpected page content error: {str(error)}"
+    
+    def _format_content(self, content_data: Dict[str, Any], url: str) -> str:
+        """Format page content and log its size."""
+        formatted_content = self.client.format_page_content(content_data, url)
+        logger.info("Content retrieval completed, length: %d", len(formatted_content))
+        return formatted_content
+    
     def execute(self, url: str) -> str:
         """Execute page content retrieval.
         
@@ -103,32 +168,36 @@ class PageContentTool:
         Returns:
             Formatted page content or error message
         """
-        if not self.is_available():
-            return "Error: Page content retrieval not available - Exa API key not configured"
-        
-        if not url:
-            return "Error: URL cannot be empty"
+        error = self._check_request(url)
+        if error:
+            return error
         
         try:
-            logger.info(f"Retrieving content for: {url}")
-            
-            # Get content
+            logger.info("Retrieving content for: %s", url)
             content_data = self.client.get_content(url)
+            return self._format_content(content_data, url)
+        except Exception as e:
+            return self._error_message(e)
+    
+    async def aexecute(self, url: str) -> str:
+        """Execute page content retrieval without blocking the event loop.
+        
+        Args:
+            url: URL of the webpage to retrieve
             
-            # Format content
-            formatted_content = self.client.format_page_content(content_data, url)
-            
-            logger.info(f"Content retrieval completed, length: {len(formatted_content)}")
-            return formatted_content
-            
-        except WebSearchError as e:
-            error_msg = f"Page content error: {e.message}"
-            if e.details:
-                error_msg += f" ({e.details})"
-            return error_msg
+        Returns:
+            Formatted page content or error message
+        """
+        error = self._check_request(url)
+        if error:
+            return error
+        
+        try:
+            logger.info("Retrieving content for: %s", url)
+            content_data = await self.client.aget_content(url)
+            return self._format_content(content_data, url)
         except Exception as e:
-            logger.error(f"Unexpected error in page content retrieval: {e}", exc_info=True)
-            return f"Error: Unexpected page content error: {str(e)}"
+            return self._error_message(e)
 
 
 # Global tool instances
@@ -152,9 +221,10 @@ def get_page_content_tool() -> PageContentTool:
     return _page_content_tool
 
 
-# Function tools for OpenAI Agents SDK
+# Function tools for OpenAI Agents SDK. They are coroutines so parallel
+# tool calls overlap on the agent's event loop instead of using threads.
 @function_tool
-def web_search(query: str, num_results: int = 5) -> str:
+async def web_search(query: str, num_results: int = 5) -> str:
     """Search the web for information using Exa search engine.
     
     Args:
@@ -165,28 +235,22 @@ def web_search(query: str, num_results: int = 5) -> str:
         Formatted search results or error message
     """
     tool = get_web_search_tool()
-    result = tool.execute(query, num_results)
+    result = await tool.aexecute(query, num_results)
     
     # Log for debugging
-    try:
-        from ..utils.debug_logger import get_debug_logger
-        debug_logger = get_debug_logger()
-        log_tool_execution(
-            "web_search",
-            {"query": query, "num_results": num_results},
-            result,
-            success=not result.startswith("Error"),
-            debug_logger=debug_logger
-        )
-    except ImportError:
-        # Debug logger not available
-        pass
+    log_tool_execution(
+        "web_search",
+        {"query": query, "num_results": num_results},
+        result,
+        success=not result.startswith("Error"),
+        debug_logger=get_debug_logger()
+    )
     
     return result
 
 
 @function_tool
-def get_page_content(url: str) -> str:
+async def get_page_content(url: str) -> str:
     """Get the content of a specific webpage.
     
     Args:
@@ -196,29 +260,27 @@ def get_page_content(url: str) -> str:
         The text content of the webpage or error message
     """
     tool = get_page_content_tool()
-    result = tool.execute(url)
+    result = await tool.aexecute(url)
     
     # Log for debugging
-    try:
-        from ..utils.debug_logger import get_debug_logger
-        debug_logger = get_debug_logger()
-        log_tool_execution(
-            "get_page_content",
-            {"url": url},
-            result,
-            success=not result.startswith("Error"),
-            debug_logger=debug_logger
-        )
-    except ImportError:
-        # Debug logger not available
-        pass
+    log_tool_execution(
+        "get_page_content",
+        {"url": url},
+        result,
+        success=not result.startswith("Error"),
+        debug_logger=get_debug_logger()
+    )
     
     return result
 
 
+@functools.lru_cache(maxsize=1)
 def check_tools_status() -> Dict[str, Any]:
     """Check status of web search tools.
     
+    The result only depends on configuration, so it is computed once per
+    process. Call ``check_tools_status.cache_clear()`` to force a re-check.
+    
     Returns:
         Status information for all web search tools
     """
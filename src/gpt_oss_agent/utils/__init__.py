@@ -1,7 +1,12 @@
 """Utility modules."""
 
 from .logging import setup_logging, get_logger, set_log_level, StructuredLogger
-from .debug_logger import get_debug_logger, set_debug_logger, DebugLogger
+from .debug_logger import (
+    get_debug_logger,
+    set_debug_logger,
+    DebugLogger,
+    NullDebugLogger,
+)
 
 __all__ = [
     "setup_logging",
@@ -11,4 +16,5 @@ __all__ = [
     "get_debug_logger",
     "set_debug_logger",
     "DebugLogger",
+    "NullDebugLogger",
 ]
\ No newline at end of file
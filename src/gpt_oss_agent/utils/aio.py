@@ -0,0 +1,84 @@
+"""Helpers for resources bound to an asyncio event loop."""
+
+import asyncio
+import threading
+import weakref
+from typing import Any, AsyncIterator, Awaitable, Callable, Generic, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+
+async def _close_at_loop_shutdown(close: Callable[[], Awaitable[Any]]) -> AsyncIterator[None]:
+    """Async generator whose cleanup awaits ``close``.
+
+    Event loops finalize unfinished async generators in
+    ``loop.shutdown_asyncgens()``, which ``asyncio.run`` calls before closing
+    the loop, so the cleanup runs on the loop the resource belongs to.
+    """
+    try:
+        yield
+    finally:
+        await close()
+
+
+class LoopLocal(Generic[T]):
+    """One lazily created resource per event loop.
+
+    Async HTTP clients hold connections that belong to the loop that opened
+    them, so code that runs on several loops (successive ``asyncio.run``
+    calls, per-agent loops) needs one client per loop. Each resource is
+    closed on its own loop when that loop shuts down, or earlier through
+    :meth:`aclose` / :meth:`close_all`.
+    """
+
+    def __init__(self, factory: Callable[[], T], close: Callable[[T], Awaitable[Any]]):
+        """Initialize the per-loop holder.
+
+        Args:
+            factory: Creates the resource for a loop
+            close: Coroutine function releasing a resource
+        """
+        self._factory = factory
+        self._close = close
+        # Values keep the cleanup generators alive; loops only track them weakly
+        self._resources: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[T, AsyncIterator[None]]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    async def get(self) -> T:
+        """Return the resource of the running loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        entry = self._resources.get(loop)
+        if entry is not None:
+            return entry[0]
+
+        resource = self._factory()
+        closer = _close_at_loop_shutdown(lambda: self._close(resource))
+        # Starting the generator registers it with the running loop
+        await closer.__anext__()
+        with self._lock:
+            self._resources[loop] = (resource, closer)
+        return resource
+
+    async def aclose(self) -> None:
+        """Close the resource of the running loop, if it has one."""
+        with self._lock:
+            entry = self._resources.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[1].aclose()
+
+    def close_all(self) -> None:
+        """Close the resources of every loop that is still open.
+
+        Cleanup is scheduled on each resource's own loop, so it completes
+        once that loop runs again (or shuts down). Resources of closed loops
+        were already released when those loops shut down.
+        """
+        with self._lock:
+            entries = list(self._resources.items())
+            self._resources.clear()
+        for loop, (_, closer) in entries:
+            if not loop.is_closed():
+                asyncio.run_coroutine_threadsafe(closer.aclose(), loop)
@@ -3,17 +3,54 @@
 Logs all messages, responses, and internal state for debugging.
 """
 
-import json
+import atexit
 import logging
+import os
+import queue
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Set, Tuple
 
 from ..config import get_settings
+from .serialization import dumps_bytes
 
 
 logger = logging.getLogger(__name__)
 
+# Values of these types are written to debug logs as-is
+_JSON_TYPES = (str, int, float, bool, type(None), list, dict, tuple)
+
+# Log directories already created by this process
+_DIRS_CREATED: Set[Path] = set()
+
+# O_BINARY only exists (and is only needed) on Windows
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _format_timestamp(timestamp_ns: int) -> str:
+    """Format a ``time.time_ns()`` value as a local ISO 8601 timestamp."""
+    seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000).isoformat()
+
+
+def _write_bytes(filepath: Path, payload: bytes) -> None:
+    """Write a payload to a file with raw, unbuffered writes.
+    
+    Args:
+        filepath: Destination file (created or truncated)
+        payload: Bytes to write
+    """
+    fd = os.open(filepath, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
 
 class DebugLogger:
     """Debug logger that dumps all messages and responses to files.
@@ -21,23 +58,46 @@ class DebugLogger:
     This logger provides detailed debugging capabilities by saving
     all agent interactions, tool executions, and internal state
     to structured JSON files.
+    
+    Files are written by a background thread so that logging does not block
+    the chat path. Call :meth:`flush` to wait for pending writes.
     """
     
-    def __init__(self, log_dir: Optional[str] = None, session_id: Optional[str] = None):
+    def __init__(
+        self,
+        log_dir: Optional[str] = None,
+        session_id: Optional[str] = None,
+        verbose: Optional[bool] = None,
+        enabled: Optional[bool] = None
+    ) -> None:
         """Initialize debug logger.
         
         Args:
             log_dir: Directory to store debug logs (uses config if None)
             session_id: Session ID (auto-generated if None)
+            verbose: Dump every attribute of runner results and items
+                (uses config if None)
+            enabled: Write log files (uses config if None)
         """
         settings = get_settings()
         
-        self.log_dir = Path(log_dir or settings.debug.log_dir)
-        self.log_dir.mkdir(parents=True, exist_ok=True)
+        # None only for loggers that never write files (NullDebugLogger)
+        self.log_dir: Optional[Path] = Path(log_dir or settings.debug.log_dir)
+        if self.log_dir not in _DIRS_CREATED:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            _DIRS_CREATED.add(self.log_dir)
         
         self.session_id = session_id or datetime.now().strftime("%Y%m%d_%H%M%S")
         self.message_count = 0
-        self.enabled = settings.debug.enabled
+        self.enabled = settings.debug.enabled if enabled is None else enabled
+        self.verbose = settings.debug.verbose if verbose is None else verbose
+        
+        # Names of files written this session, so summaries avoid a directory scan
+        self._session_files: Set[str] = set()
+        
+        self._queue: queue.Queue[Optional[Tuple[Path, Dict[str, Any]]]] = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
         
         if self.enabled:
             logger.info(f"Debug logger initialized. Session ID: {self.session_id}")
@@ -46,26 +106,70 @@ class DebugLogger:
             logger.debug("Debug logging is disabled")
     
     def _write_log_file(self, filename: str, data: Dict[str, Any]) -> Optional[str]:
-        """Write data to log file.
+        """Queue data to be written to a log file.
         
         Args:
             filename: Log file name
             data: Data to write
             
         Returns:
-            File path if written, None if disabled
+            File path the data will be written to, None if disabled
         """
-        if not self.enabled:
+        if not self.enabled or self.log_dir is None:
             return None
         
-        try:
-            filepath = self.log_dir / filename
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
-            return str(filepath)
-        except Exception as e:
-            logger.error(f"Failed to write debug log {filename}: {e}")
-            return None
+        self._ensure_writer()
+        filepath = self.log_dir / filename
+        self._session_files.add(filename)
+        self._queue.put((filepath, data))
+        return str(filepath)
+    
+    def _ensure_writer(self) -> None:
+        """Start the background writer thread if it is not running."""
+        if self._writer is not None:
+            return
+        
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._writer_loop,
+                    name="debug-log-writer",
+                    daemon=True,
+                )
+                self._writer.start()
+                atexit.register(self.close)
+    
+    def _writer_loop(self) -> None:
+        """Drain the write queue until the shutdown sentinel arrives."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                filepath, data = item
+                try:
+                    data["timestamp"] = _format_timestamp(data["timestamp"])
+                    _write_bytes(filepath, dumps_bytes(data))
+                except Exception as e:
+                    logger.error("Failed to write debug log %s: %s", filepath.name, e)
+            finally:
+                self._queue.task_done()
+    
+    def flush(self) -> None:
+        """Block until all queued log files have been written."""
+        if self._writer is not None:
+            self._queue.join()
+    
+    def close(self) -> None:
+        """Write any pending log files and stop the writer thread."""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is None:
+            return
+        
+        self._queue.put(None)
+        writer.join()
+        atexit.unregister(self.close)
     
     def log_user_input(self, message: str) -> Optional[str]:
         """Log user input message.
@@ -77,15 +181,14 @@ class DebugLogger:
             Log file path or None if disabled
         """
         self.message_count += 1
-        timestamp = datetime.now().isoformat()
+        timestamp = time.time_ns()
         
         log_data = {
             "session_id": self.session_id,
             "message_count": self.message_count,
             "timestamp": timestamp,
             "type": "user_input",
-            "message": message,
-            "message_length": len(message)
+            "message": message
         }
         
         filename = f"{self.session_id}_msg{self.message_count:03d}_input.json"
@@ -99,18 +202,27 @@ class DebugLogger:
     def log_agent_response(
         self, 
         response: str, 
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        metadata_factory: Optional[Callable[[], Dict[str, Any]]] = None
     ) -> Optional[str]:
         """Log agent response.
         
         Args:
             response: Agent response
             metadata: Additional metadata about the response
+            metadata_factory: Callable building metadata, only invoked when
+                logging is enabled
             
         Returns:
             Log file path or None if disabled
         """
-        timestamp = datetime.now().isoformat()
+        if not self.enabled:
+            return None
+        
+        if metadata is None and metadata_factory is not None:
+            metadata = metadata_factory()
+        
+        timestamp = time.time_ns()
         
         log_data = {
             "session_id": self.session_id,
@@ -118,7 +230,6 @@ class DebugLogger:
             "timestamp": timestamp,
             "type": "agent_response",
             "response": response,
-            "response_length": len(response) if response else 0,
             "is_empty": not bool(response),
             "metadata": metadata or {}
         }
@@ -140,7 +251,7 @@ class DebugLogger:
         Returns:
             Log file path or None if disabled
         """
-        timestamp = datetime.now().isoformat()
+        timestamp = time.time_ns()
         
         # Extract key information from result
         result_data = {
@@ -151,27 +262,25 @@ class DebugLogger:
             "result_type": str(type(result)),
             "has_final_output": hasattr(result, 'final_output'),
             "final_output": getattr(result, 'final_output', None),
-            "final_output_length": len(str(getattr(result, 'final_output', ''))) if getattr(result, 'final_output', None) else 0,
-            "attributes": dir(result) if result else [],
         }
         
-        # Add more detailed information if available
-        if hasattr(result, '__dict__'):
-            try:
-                # Convert complex objects to strings for JSON serialization
-                result_dict = {}
-                for key, value in result.__dict__.items():
-                    try:
-                        # Try to serialize directly
-                        json.dumps(value, default=str)
-                        result_dict[key] = value
-                    except (TypeError, ValueError):
-                        # If not serializable, convert to string
-                        result_dict[key] = str(value)[:1000]  # Limit length
-                
-                result_data["result_dict"] = result_dict
-            except Exception as e:
-                result_data["result_dict_error"] = str(e)
+        # Full attribute dumps are expensive, so only include them when verbose
+        if self.verbose:
+            result_data["attributes"] = dir(result) if result else []
+            
+            if hasattr(result, '__dict__'):
+                try:
+                    # Keep JSON-friendly values, stringify everything else
+                    result_dict = {}
+                    for key, value in result.__dict__.items():
+                        if isinstance(value, _JSON_TYPES):
+                            result_dict[key] = value
+                        else:
+                            result_dict[key] = str(value)[:1000]  # Limit length
+                    
+                    result_data["result_dict"] = result_dict
+                except Exception as e:
+                    result_data["result_dict_error"] = str(e)
         
         # Log new_items if available with enhanced extraction
         if hasattr(result, 'new_items') and result.new_items:
@@ -201,8 +310,9 @@ class DebugLogger:
             item_info = {
                 "index": i,
                 "type": getattr(item, 'type', str(type(item))),
-                "attributes": dir(item),
             }
+            if self.verbose:
+                item_info["attributes"] = dir(item)
             
             # Extract text from MessageOutputItem
             if hasattr(item, 'type') and item.type == 'message_output_item':
@@ -249,7 +359,8 @@ class DebugLogger:
                 tool_info["arguments"] = raw_item.arguments
         
         # Add truncated string representation for debugging
-        tool_info["raw_item_str"] = str(item)[:500] + "..." if len(str(item)) > 500 else str(item)
+        item_str = str(item)
+        tool_info["raw_item_str"] = item_str[:500] + "..." if len(item_str) > 500 else item_str
         return tool_info
     
     def log_tool_execution(
@@ -268,7 +379,7 @@ class DebugLogger:
         Returns:
             Log file path or None if disabled
         """
-        timestamp = datetime.now().isoformat()
+        timestamp = time.time_ns()
         
         log_data = {
             "session_id": self.session_id,
@@ -278,7 +389,6 @@ class DebugLogger:
             "tool_name": tool_name,
             "arguments": args,
             "result": result,
-            "result_length": len(result) if result else 0,
             "success": bool(result and not result.startswith("Error"))
         }
         
@@ -300,7 +410,7 @@ class DebugLogger:
         Returns:
             Log file path or None if disabled
         """
-        timestamp = datetime.now().isoformat()
+        timestamp = time.time_ns()
         
         log_data = {
             "session_id": self.session_id,
@@ -329,7 +439,7 @@ class DebugLogger:
         if not self.enabled:
             return {"enabled": False}
         
-        log_files = list(self.log_dir.glob(f"{self.session_id}_*.json"))
+        log_files = sorted(self._session_files)
         
         return {
             "enabled": True,
@@ -337,23 +447,86 @@ class DebugLogger:
             "message_count": self.message_count,
             "log_dir": str(self.log_dir),
             "total_log_files": len(log_files),
-            "log_files": [f.name for f in sorted(log_files)]
+            "log_files": log_files
         }
 
 
+class NullDebugLogger(DebugLogger):
+    """Debug logger that discards everything.
+    
+    Used when debug logging is disabled so callers can log unconditionally
+    without paying for log entry construction or touching the filesystem.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize a disabled logger without creating the log directory."""
+        self.log_dir = None
+        self.session_id = ""
+        self.message_count = 0
+        self.enabled = False
+        self.verbose = False
+        self._session_files = set()
+        self._writer = None
+    
+    def log_user_input(self, message: str) -> Optional[str]:
+        return None
+    
+    def log_agent_response(
+        self,
+        response: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        metadata_factory: Optional[Callable[[], Dict[str, Any]]] = None
+    ) -> Optional[str]:
+        return None
+    
+    def log_runner_result(self, result: Any) -> Optional[str]:
+        return None
+    
+    def log_tool_execution(
+        self,
+        tool_name: str,
+        args: Dict[str, Any],
+        result: str
+    ) -> Optional[str]:
+        return None
+    
+    def log_error(self, error: Exception, context: str = "") -> Optional[str]:
+        return None
+    
+    def flush(self) -> None:
+        pass
+    
+    def close(self) -> None:
+        pass
+
+
 # Global debug logger instance
 _debug_logger: Optional[DebugLogger] = None
 
 
-def get_debug_logger() -> DebugLogger:
+def get_debug_logger(enabled: Optional[bool] = None) -> DebugLogger:
     """Get global debug logger instance.
     
+    Returns a :class:`NullDebugLogger` when debug logging is disabled in
+    the settings at first use, unless a caller explicitly asks for it.
+    
+    Args:
+        enabled: Force a logging instance even if debug logging is disabled
+            in the settings (uses config if None)
+    
     Returns:
         DebugLogger instance
     """
     global _debug_logger
-    if _debug_logger is None:
-        _debug_logger = DebugLogger()
+    if enabled and (_debug_logger is None or isinstance(_debug_logger, NullDebugLogger)):
+        # An explicit opt-in replaces the no-op logger for every caller, so
+        # tool executions are logged alongside the agent's messages
+        _debug_logger = DebugLogger(enabled=True)
+    elif _debug_logger is None:
+        if get_settings().debug.enabled:
+            _debug_logger = DebugLogger()
+        else:
+            _debug_logger = NullDebugLogger()
     return _debug_logger
 
 
@@ -0,0 +1,25 @@
+"""HTTP response helpers shared by the API clients."""
+
+import httpx
+
+
+# Bytes of an error response body kept for diagnostics
+ERROR_DETAIL_BYTES = 2048
+
+
+def response_excerpt(response: httpx.Response, limit: int = ERROR_DETAIL_BYTES) -> str:
+    """Decode the start of a response body for error details.
+    
+    Error pages can be large; only the first ``limit`` bytes are decoded so
+    exceptions and log lines stay small.
+    
+    Args:
+        response: Response whose body is being reported
+        limit: Maximum number of bytes to decode
+        
+    Returns:
+        Decoded excerpt, suffixed with ``...`` when the body was cut
+    """
+    content = response.content
+    excerpt = content[:limit].decode(response.encoding or "utf-8", errors="replace")
+    return excerpt + "..." if len(content) > limit else excerpt
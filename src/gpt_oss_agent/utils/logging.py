@@ -1,57 +1,82 @@
 """Logging configuration utilities."""
 
+import functools
 import logging
+import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from ..config import Settings, get_settings
 
 
+# Handlers installed by setup_logging, reused across calls
+_console_handler: Optional[logging.StreamHandler] = None
+_file_handler: Optional[logging.FileHandler] = None
+
+
+@functools.lru_cache(maxsize=4)
+def _get_formatter(fmt: str) -> logging.Formatter:
+    """Get a shared formatter for a format string."""
+    return logging.Formatter(fmt)
+
+
 def setup_logging(settings: Optional[Settings] = None) -> None:
     """Set up application logging.
     
+    Safe to call repeatedly: the console and file handlers are created once
+    and reconfigured in place, so calls do not accumulate handlers.
+    
     Args:
         settings: Configuration settings (uses global if None)
     """
+    global _console_handler, _file_handler
+    
     settings = settings or get_settings()
     
     # Configure root logger
     root_logger = logging.getLogger()
     
-    # Clear any existing handlers
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
-    
     # Set log level
     log_level = getattr(logging, settings.logging.level.upper(), logging.INFO)
     root_logger.setLevel(log_level)
     
-    # Create formatter
-    formatter = logging.Formatter(settings.logging.format)
-    
     # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(log_level)
-    console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    if _console_handler is None:
+        _console_handler = logging.StreamHandler(sys.stdout)
+    handlers: List[logging.Handler] = [_console_handler]
     
-    # File handler (optional)
+    # File handler (optional), only reopened when the path changes
     if settings.logging.file:
         log_file = Path(settings.logging.file)
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(log_level)
-        file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        if _file_handler is None or _file_handler.baseFilename != os.path.abspath(log_file):
+            if _file_handler is not None:
+                _file_handler.close()
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            _file_handler = logging.FileHandler(log_file)
+        handlers.append(_file_handler)
+    elif _file_handler is not None:
+        _file_handler.close()
+        _file_handler = None
+    
+    # Remove any other handlers, including stale ones from earlier calls
+    for handler in root_logger.handlers[:]:
+        if handler not in handlers:
+            root_logger.removeHandler(handler)
+    
+    formatter = _get_formatter(settings.logging.format)
+    for handler in handlers:
+        handler.setLevel(log_level)
+        handler.setFormatter(formatter)
+        if handler not in root_logger.handlers:
+            root_logger.addHandler(handler)
     
     # Reduce noise from some libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("httpcore").setLevel(logging.WARNING)
     logging.getLogger("openai").setLevel(logging.INFO)
     
-    logging.info(f"Logging configured at {settings.logging.level} level")
+    logging.info("Logging configured at %s level", settings.logging.level)
 
 
 def get_logger(name: str) -> logging.Logger:
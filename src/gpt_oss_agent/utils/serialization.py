@@ -0,0 +1,65 @@
+"""JSON serialization helpers.
+
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on optional dependency
+    _HAS_ORJSON = False
+
+
+_ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS if _HAS_ORJSON else 0
+
+
+def dumps_bytes(data: Any, indent: bool = True) -> bytes:
+    """Serialize data to UTF-8 encoded JSON.
+
+    Objects that are not JSON serializable are converted with ``str``.
+
+    Args:
+        data: Data to serialize
+        indent: Whether to pretty-print with two-space indentation
+
+    Returns:
+        Encoded JSON document
+    """
+    if _HAS_ORJSON:
+        try:
+            return orjson.dumps(
+                data,
+                default=str,
+                option=_ORJSON_OPTIONS if indent else orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            # orjson rejects some values the stdlib accepts (e.g. integers
+            # wider than 64 bits); fall through to json for those.
+            pass
+
+    return json.dumps(
+        data,
+        indent=2 if indent else None,
+        ensure_ascii=False,
+        default=str,
+    ).encode("utf-8")
+
+
+def loads(data: Any) -> Any:
+    """Deserialize a JSON document.
+
+    Args:
+        data: JSON document as ``str``, ``bytes``, ``bytearray`` or
+            ``memoryview`` (e.g. of a memory-mapped file)
+
+    Returns:
+        Decoded Python object
+    """
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
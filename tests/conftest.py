@@ -1,5 +1,10 @@
 """Pytest configuration and fixtures for gpt-oss-agent tests."""
 
+import http.server
+import json
+import threading
+from types import SimpleNamespace
+
 import pytest
 from pathlib import Path
 import sys
@@ -23,6 +28,72 @@ def test_settings():
     )
 
 
+@pytest.fixture
+def vllm_server():
+    """Serve a minimal vLLM API on a local port.
+    
+    Provides ``/v1/models`` plus text and chat completions that echo the
+    prompt. Text completion choices are returned in reverse index order, as
+    a server may do. The fixture exposes the base ``url``, the ``requests``
+    received as ``(method, path)`` pairs, and ``unavailable``: the number of
+    upcoming model list requests answered with HTTP 503.
+    """
+    state = SimpleNamespace(url="", requests=[], unavailable=0)
+    
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        
+        def _reply(self, status, body):
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        
+        def do_GET(self):
+            state.requests.append(("GET", self.path))
+            if state.unavailable > 0:
+                state.unavailable -= 1
+                self._reply(503, {"error": "loading"})
+                return
+            self._reply(200, {"object": "list", "data": [{"id": "test-model", "object": "model"}]})
+        
+        def do_POST(self):
+            state.requests.append(("POST", self.path))
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            
+            if self.path.endswith("/chat/completions"):
+                content = "chat: " + request["messages"][-1]["content"]
+                choices = [{
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": content},
+                }]
+                self._reply(200, {"id": "chat", "object": "chat.completion", "created": 0,
+                                  "model": request["model"], "choices": choices})
+                return
+            
+            prompts = request["prompt"] if isinstance(request["prompt"], list) else [request["prompt"]]
+            choices = [
+                {"index": i, "text": "echo: " + prompt, "finish_reason": "stop", "logprobs": None}
+                for i, prompt in enumerate(prompts)
+            ]
+            self._reply(200, {"id": "cmpl", "object": "text_completion", "created": 0,
+                              "model": request["model"], "choices": choices[::-1]})
+        
+        def log_message(self, *args):
+            pass
+    
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    state.url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
 @pytest.fixture
 def mock_vllm_client():
     """Mock vLLM client for testing."""
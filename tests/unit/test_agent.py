@@ -0,0 +1,237 @@
+"""Test core agent functionality."""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from gpt_oss_agent.config import Settings
+from gpt_oss_agent.core import agent as agent_module
+from gpt_oss_agent.core import GPTOSSAgent
+from gpt_oss_agent.exceptions import EmptyResponseError
+
+
+@pytest.fixture
+def fake_runner(monkeypatch):
+    """Replace Runner.run with a coroutine that echoes the message."""
+    calls = []
+
+    async def fake_run(agent, message, **kwargs):
+        calls.append(message)
+        return SimpleNamespace(final_output=f"echo: {message}", new_items=[])
+
+    monkeypatch.setattr(agent_module.Runner, "run", fake_run)
+    return calls
+
+
+def test_chat_uses_async_runner(fake_runner):
+    """Test that chat() delegates to the async runner."""
+    agent = GPTOSSAgent(settings=Settings())
+
+    assert agent.chat("hello") == "echo: hello"
+    assert fake_runner == ["hello"]
+
+
+def test_achat_runs_concurrently(fake_runner):
+    """Test that several achat() calls can be awaited together."""
+    agent = GPTOSSAgent(settings=Settings())
+
+    async def run_all():
+        return await asyncio.gather(*(agent.achat(f"m{i}") for i in range(3)))
+
+    assert asyncio.run(run_all()) == ["echo: m0", "echo: m1", "echo: m2"]
+
+
+def test_pooled_client_follows_event_loop(monkeypatch, vllm_server):
+    """Test that the pooled client works across asyncio.run() and chat() loops."""
+    clients = []
+
+    async def fake_run(agent, message, **kwargs):
+        # A real request fails if the client belongs to another (closed) loop
+        provider = kwargs["run_config"].model_provider
+        clients.append(provider._client)
+        models = await provider._client.models.list()
+        return SimpleNamespace(final_output=f"{message}: {models.data[0].id}", new_items=[])
+
+    monkeypatch.setattr(agent_module.Runner, "run", fake_run)
+    settings = Settings()
+    settings.vllm.base_url = vllm_server.url
+    settings.vllm.max_retries = 0
+    agent = GPTOSSAgent(settings=settings)
+    try:
+        assert asyncio.run(agent.achat("a")) == "a: test-model"
+        assert asyncio.run(agent.achat("b")) == "b: test-model"
+        assert agent.chat("c") == "c: test-model"
+        assert asyncio.run(agent.achat("d")) == "d: test-model"
+        assert agent.chat("e") == "e: test-model"
+    finally:
+        agent.close()
+
+    # One client per loop, each closed when its loop shut down or on close()
+    assert len(set(map(id, clients))) == 4
+    assert all(client.is_closed() for client in clients)
+
+
+def test_chat_from_several_threads(monkeypatch):
+    """Test that threads sharing an agent can call chat() concurrently."""
+    async def slow_run(agent, message, **kwargs):
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(final_output=f"echo: {message}", new_items=[])
+
+    monkeypatch.setattr(agent_module.Runner, "run", slow_run)
+    agent = GPTOSSAgent(settings=Settings())
+    results = {}
+
+    def worker(i):
+        results[i] = agent.chat(f"m{i}")
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    agent.close()
+
+    assert results == {i: f"echo: m{i}" for i in range(4)}
+
+
+def test_empty_response_raises(monkeypatch):
+    """Test that an empty result raises EmptyResponseError."""
+    async def fake_run(agent, message, **kwargs):
+        return SimpleNamespace(final_output=None, new_items=[])
+
+    monkeypatch.setattr(agent_module.Runner, "run", fake_run)
+    agent = GPTOSSAgent(settings=Settings())
+
+    with pytest.raises(EmptyResponseError):
+        agent.chat("hello")
+
+
+def test_response_cache_hits_and_invalidation(fake_runner):
+    """Test that repeated messages are served from the response cache."""
+    settings = Settings()
+    settings.agent.response_cache_size = 8
+    agent = GPTOSSAgent(settings=settings)
+
+    assert agent.chat("hello") == "echo: hello"
+    assert agent.chat("  hello ") == "echo: hello"
+    assert fake_runner == ["hello"]
+
+    agent.update_instructions("Be brief.")
+    agent.chat("hello")
+    assert fake_runner == ["hello", "hello"]
+
+
+def test_response_cache_disabled_by_default(fake_runner):
+    """Test that caching is opt-in."""
+    agent = GPTOSSAgent(settings=Settings())
+
+    agent.chat("hello")
+    agent.chat("hello")
+    assert fake_runner == ["hello", "hello"]
+
+
+def test_add_and_remove_tool_by_name():
+    """Test tool management keyed by tool name."""
+    def lookup(query: str) -> str:
+        return query
+
+    agent = GPTOSSAgent(settings=Settings())
+    agent.add_tool(lookup)
+    agent.add_tool(lookup)
+
+    assert agent.get_info()["available_tools"] == ["lookup"]
+    assert agent.agent.tools == [lookup]
+
+    agent.remove_tool(lookup)
+    assert agent.tools == ()
+    assert agent.agent.tools == []
+
+
+def test_get_info_tracks_instruction_updates():
+    """Test that get_info reflects updated instructions."""
+    agent = GPTOSSAgent(settings=Settings(), instructions="Be helpful.")
+    assert agent.get_info()["instructions_length"] == len("Be helpful.")
+
+    agent.update_instructions("Be brief.")
+    assert agent.get_info()["instructions_length"] == len("Be brief.")
+
+
+def test_chat_many_preserves_order(fake_runner):
+    """Test that chat_many returns responses in message order."""
+    agent = GPTOSSAgent(settings=Settings())
+
+    responses = agent.chat_many(["a", "b", "c"], max_concurrency=2)
+
+    assert responses == ["echo: a", "echo: b", "echo: c"]
+    assert sorted(fake_runner) == ["a", "b", "c"]
+
+
+def test_debug_logging_records_chat(fake_runner, tmp_path):
+    """Test that debug mode writes input and response logs."""
+    from gpt_oss_agent.utils import DebugLogger, set_debug_logger
+
+    debug_logger = DebugLogger(log_dir=str(tmp_path), session_id="test")
+    debug_logger.enabled = True
+    set_debug_logger(debug_logger)
+    try:
+        agent = GPTOSSAgent(settings=Settings(), debug=True)
+        agent.chat("hello")
+        summary = debug_logger.get_session_summary()
+        debug_logger.flush()
+    finally:
+        debug_logger.close()
+        set_debug_logger(None)
+
+    names = sorted(p.name for p in tmp_path.iterdir())
+    assert "test_msg001_input.json" in names
+    assert "test_msg001_response.json" in names
+    assert summary["log_files"] == sorted(names)
+
+
+def test_debug_opt_in_overrides_disabled_setting(fake_runner, tmp_path, monkeypatch):
+    """Test that debug=True logs even when debug logging is off in settings."""
+    from gpt_oss_agent.config import get_settings
+    from gpt_oss_agent.utils import get_debug_logger, set_debug_logger
+
+    monkeypatch.setattr(get_settings().debug, "enabled", False)
+    monkeypatch.setattr(get_settings().debug, "log_dir", str(tmp_path))
+    set_debug_logger(None)
+    try:
+        assert not get_debug_logger().enabled
+        agent = GPTOSSAgent(settings=Settings(), debug=True)
+        agent.chat("hello")
+        debug_logger = get_debug_logger()
+        debug_logger.flush()
+    finally:
+        get_debug_logger().close()
+        set_debug_logger(None)
+
+    assert debug_logger.enabled
+    assert any(p.name.endswith("_msg001_input.json") for p in tmp_path.iterdir())
+
+
+def test_default_instructions_detect_web_search_tools():
+    """Test that web search function tools select the web search prompt."""
+    from gpt_oss_agent.core.instructions import get_default_instructions
+    from gpt_oss_agent.tools import web_search
+
+    agent = GPTOSSAgent(settings=Settings(), tools=[web_search])
+
+    assert agent.agent.instructions == get_default_instructions(has_web_search=True)
+
+
+def test_extract_response_from_latest_message_item():
+    """Test extraction from new_items when final_output is empty."""
+    def message_item(*texts):
+        content = [SimpleNamespace(type="output_text", text=t) for t in texts]
+        return SimpleNamespace(type="message_output_item", raw_item=SimpleNamespace(content=content))
+
+    result = SimpleNamespace(
+        final_output="",
+        new_items=[message_item("first answer"), message_item("", "latest answer")],
+    )
+    agent = GPTOSSAgent(settings=Settings())
+
+    assert agent._extract_response(result) == "latest answer"
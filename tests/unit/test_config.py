@@ -24,4 +24,22 @@ def test_custom_settings(test_settings):
 def test_get_settings():
     """Test global settings getter."""
     settings = get_settings()
-    assert isinstance(settings, Settings)
\ No newline at end of file
+    assert isinstance(settings, Settings)
+
+
+def test_legacy_exa_api_key_enables_web_search(monkeypatch):
+    """Test that the legacy EXA_API_KEY variable enables web search."""
+    monkeypatch.setenv("EXA_API_KEY", "legacy-key")
+    settings = Settings(_env_file=None)
+
+    assert settings.exa.api_key == "legacy-key"
+    assert settings.exa.enabled
+
+
+def test_legacy_env_overrides_nested_settings(monkeypatch):
+    """Test that legacy flat variables take precedence over nested ones."""
+    monkeypatch.setenv("VLLM__MODEL", "nested-model")
+    monkeypatch.setenv("DEFAULT_MODEL", "legacy-model")
+    settings = Settings(_env_file=None)
+
+    assert settings.vllm.model == "legacy-model"
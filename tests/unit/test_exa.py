@@ -0,0 +1,164 @@
+"""Test the Exa search client with mocked HTTP transports."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from gpt_oss_agent.clients import exa as exa_module
+from gpt_oss_agent.clients import ExaSearchClient
+from gpt_oss_agent.config import Settings
+from gpt_oss_agent.exceptions import WebSearchError
+
+
+def make_client(handler):
+    """Return an Exa client whose sync and async HTTP clients use ``handler``."""
+    client = ExaSearchClient(Settings(_env_file=None, exa={"api_key": "test-key"}))
+    options = client._client_options
+    client._client_options = lambda: {**options(), "transport": httpx.MockTransport(handler)}
+    return client
+
+
+class FakeExa:
+    """Request handler answering like the Exa API and recording payloads."""
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request):
+        payload = json.loads(request.content)
+        self.requests.append((request.url.path, request.headers["x-api-key"], payload))
+        if request.url.path == "/search":
+            results = [{"title": "Café", "url": "https://example.com", "text": payload["query"]}]
+        else:
+            results = [{"url": url, "text": f"page {url}"} for url in payload["ids"]]
+        return httpx.Response(200, json={"results": results})
+
+
+def test_search_and_contents():
+    """Test sync search and a batched content request."""
+    exa = FakeExa()
+    with make_client(exa) as client:
+        results = client.search("python", num_results=3)
+        contents = client.get_contents(["https://a.com", "https://b.com"], include_summary=False)
+
+    assert results["results"][0]["title"] == "Café"
+    assert [r["url"] for r in contents["results"]] == ["https://a.com", "https://b.com"]
+
+    (search_path, api_key, search), (contents_path, _, content) = exa.requests
+    assert (search_path, api_key) == ("/search", "test-key")
+    assert search["query"] == "python" and search["numResults"] == 3
+    # Both URLs travel in one /contents request
+    assert contents_path == "/contents"
+    assert content == {"ids": ["https://a.com", "https://b.com"],
+                       "contents": {"text": True, "summary": False}}
+
+
+def test_async_search_and_contents():
+    """Test async search and content requests issued together."""
+    exa = FakeExa()
+    client = make_client(exa)
+
+    async def run():
+        try:
+            return await asyncio.gather(
+                client.asearch("python"),
+                client.aget_contents(["https://a.com", "https://b.com"]),
+                client.aget_content("https://c.com"),
+            )
+        finally:
+            await client.aclose()
+
+    results, contents, content = asyncio.run(run())
+
+    assert results["results"][0]["text"] == "python"
+    assert len(contents["results"]) == 2
+    assert content["results"][0]["url"] == "https://c.com"
+    assert sorted(path for path, _, _ in exa.requests) == ["/contents", "/contents", "/search"]
+
+
+def test_responses_are_decoded_from_bytes(monkeypatch):
+    """Test that response bodies go to the JSON decoder as raw bytes."""
+    decoded = []
+    real_loads = exa_module.loads
+
+    def spy(data):
+        decoded.append(type(data))
+        return real_loads(data)
+
+    monkeypatch.setattr(exa_module, "loads", spy)
+    with make_client(FakeExa()) as client:
+        assert client.search("café")["results"][0]["text"] == "café"
+
+    assert decoded == [bytes]
+
+
+@pytest.mark.parametrize("error, search_message, content_message", [
+    (httpx.ConnectTimeout("slow"), "Search request timed out", "Content retrieval timed out"),
+    (httpx.ConnectError("refused"), "Search request failed: refused", "Content retrieval failed: refused"),
+    (ValueError("boom"), "Unexpected search error: boom", "Unexpected content retrieval error: boom"),
+])
+def test_transport_errors_become_web_search_errors(error, search_message, content_message):
+    """Test that transport errors from either client raise WebSearchError."""
+    def handler(request):
+        raise error
+
+    client = make_client(handler)
+    with pytest.raises(WebSearchError, match=search_message):
+        client.search("python")
+    with pytest.raises(WebSearchError, match=content_message):
+        client.get_contents(["https://a.com"])
+
+    async def run():
+        try:
+            await client.asearch("python")
+        finally:
+            await client.aclose()
+
+    with pytest.raises(WebSearchError, match=search_message):
+        asyncio.run(run())
+    client.close()
+
+
+def test_error_status_keeps_response_excerpt():
+    """Test that an HTTP error status is reported with the response body."""
+    def handler(request):
+        return httpx.Response(500, text="upstream exploded")
+
+    client = make_client(handler)
+
+    with pytest.raises(WebSearchError) as sync_error:
+        client.get_contents(["https://a.com"])
+
+    async def run():
+        try:
+            await client.asearch("python")
+        finally:
+            await client.aclose()
+
+    with pytest.raises(WebSearchError) as async_error:
+        asyncio.run(run())
+
+    assert "Content retrieval failed with status 500" in str(sync_error.value)
+    assert "Search request failed with status 500" in str(async_error.value)
+    assert async_error.value.details == "upstream exploded"
+
+
+def test_invalid_requests_are_rejected_before_sending(monkeypatch):
+    """Test argument validation and the unavailable client."""
+    monkeypatch.delenv("EXA_API_KEY", raising=False)
+    monkeypatch.delenv("EXA__API_KEY", raising=False)
+    exa = FakeExa()
+    client = make_client(exa)
+
+    with pytest.raises(WebSearchError, match="empty"):
+        client.search("  ")
+    with pytest.raises(WebSearchError, match="empty"):
+        client.get_contents(["https://a.com", ""])
+
+    disabled = ExaSearchClient(Settings(_env_file=None))
+    with pytest.raises(WebSearchError, match="not available"):
+        disabled.search("python")
+
+    assert exa.requests == []
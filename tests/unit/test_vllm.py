@@ -0,0 +1,156 @@
+"""Test vLLM clients against a local server."""
+
+import asyncio
+import itertools
+import socket
+import time
+
+import pytest
+
+from gpt_oss_agent.clients import vllm as vllm_module
+from gpt_oss_agent.clients import AsyncVLLMClient, VLLMClient
+from gpt_oss_agent.config import Settings
+from gpt_oss_agent.exceptions import VLLMConnectionError
+
+
+def make_settings(base_url):
+    """Return settings pointing at ``base_url`` without SDK retries."""
+    settings = Settings(_env_file=None)
+    settings.vllm.base_url = base_url
+    settings.vllm.max_retries = 0
+    return settings
+
+
+@pytest.fixture
+def closed_port_url():
+    """Return a base URL on a local port nothing listens on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/v1"
+
+
+def model_requests(server):
+    """Return the paths of the model list requests the server received."""
+    return [path for method, path in server.requests if method == "GET"]
+
+
+def test_health_check_fills_model_info_cache(vllm_server):
+    """Test that get_model_info reuses the health check response."""
+    with VLLMClient(make_settings(vllm_server.url)) as client:
+        assert client.health_check()
+        info = client.get_model_info()
+
+        assert info["available_models"] == ["test-model"]
+        assert model_requests(vllm_server) == ["/v1/models"]
+
+        client.get_model_info(refresh=True)
+        assert len(model_requests(vllm_server)) == 2
+
+
+def test_model_info_cache_expires(vllm_server, monkeypatch):
+    """Test that cached model info is dropped after MODEL_INFO_TTL."""
+    monkeypatch.setattr(vllm_module, "MODEL_INFO_TTL", 0.0)
+
+    with VLLMClient(make_settings(vllm_server.url)) as client:
+        client.get_model_info()
+        client.get_model_info()
+
+    assert len(model_requests(vllm_server)) == 2
+
+
+def test_batch_complete_keeps_prompt_order(vllm_server):
+    """Test that completions are returned in prompt order."""
+    with VLLMClient(make_settings(vllm_server.url)) as client:
+        assert client.batch_complete(["a", "b", "c"]) == ["echo: a", "echo: b", "echo: c"]
+        assert client.batch_complete([]) == []
+
+    assert vllm_server.requests.count(("POST", "/v1/completions")) == 1
+
+
+def test_connection_with_completion(vllm_server):
+    """Test the full connection test against a healthy server."""
+    with VLLMClient(make_settings(vllm_server.url)) as client:
+        result = client.test_connection(cheap=False)
+
+    assert result["health_check_passed"]
+    assert result["available_models"] == ["test-model"]
+    assert result["completion_passed"]
+    assert result["error"] is None
+
+
+def test_wait_for_server_retries_until_ready(vllm_server):
+    """Test that wait_for_server keeps polling while the server is loading."""
+    vllm_server.unavailable = 2
+
+    with VLLMClient(make_settings(vllm_server.url)) as client:
+        assert client.wait_for_server(max_wait=5, check_interval=0.01)
+
+    assert len(model_requests(vllm_server)) == 3
+
+
+def test_wait_for_server_stops_at_deadline(closed_port_url):
+    """Test that wait_for_server gives up once max_wait has passed."""
+    with VLLMClient(make_settings(closed_port_url)) as client:
+        start = time.monotonic()
+        with pytest.raises(VLLMConnectionError):
+            client.wait_for_server(max_wait=0.3, check_interval=0.05, max_interval=0.1)
+        elapsed = time.monotonic() - start
+
+    assert 0.3 <= elapsed < 1.0
+
+
+def test_backoff_delays_double_up_to_max(monkeypatch):
+    """Test the backoff schedule without jitter."""
+    monkeypatch.setattr(vllm_module.random, "uniform", lambda low, high: 1.0)
+
+    delays = vllm_module._backoff_delays(60, 0.1, 0.5)
+    assert list(itertools.islice(delays, 5)) == pytest.approx([0.1, 0.2, 0.4, 0.5, 0.5])
+
+
+def test_backoff_delays_end_at_deadline():
+    """Test that sleeping through the delays stops at max_wait."""
+    start = time.monotonic()
+    for delay in vllm_module._backoff_delays(0.1, 0.02, 0.04):
+        time.sleep(delay)
+
+    assert 0.1 <= time.monotonic() - start < 0.5
+    assert next(vllm_module._backoff_delays(0, 0.1, 1.0), None) is None
+
+
+def test_async_client(vllm_server):
+    """Test the async client's probes, cache and batch helpers."""
+    async def run():
+        async with AsyncVLLMClient(make_settings(vllm_server.url)) as client:
+            healthy = await client.health_check()
+            info = await client.get_model_info()
+            completions = await client.batch_complete(["a", "b"])
+            replies = await client.batch_chat(["x", "y", "z"])
+            result = await client.test_connection()
+        return healthy, info, completions, replies, result
+
+    healthy, info, completions, replies, result = asyncio.run(run())
+
+    assert healthy
+    assert info["available_models"] == ["test-model"]
+    assert completions == ["echo: a", "echo: b"]
+    assert replies == ["chat: x", "chat: y", "chat: z"]
+    assert result["model_info_available"]
+    # health_check filled the cache; test_connection probed once more
+    assert len(model_requests(vllm_server)) == 2
+    assert vllm_server.requests.count(("POST", "/v1/chat/completions")) == 3
+
+
+def test_async_wait_for_server(vllm_server, closed_port_url):
+    """Test async wait_for_server against ready and unreachable servers."""
+    vllm_server.unavailable = 1
+
+    async def run():
+        async with AsyncVLLMClient(make_settings(vllm_server.url)) as client:
+            assert await client.wait_for_server(max_wait=5, check_interval=0.01)
+        async with AsyncVLLMClient(make_settings(closed_port_url)) as client:
+            with pytest.raises(VLLMConnectionError):
+                await client.wait_for_server(max_wait=0.2, check_interval=0.05)
+
+    asyncio.run(run())
+    assert len(model_requests(vllm_server)) == 2